@@ -4,14 +4,47 @@ API server entry point.
 
 Run with: python api_server.py
 Or: uvicorn ai_threat_model.api.main:app --reload
+
+For production, pass --workers to run several worker processes without reload:
+    python api_server.py --workers 4
 """
 
+import argparse
+import os
+
 import uvicorn
 
 if __name__ == "__main__":
-    uvicorn.run(
-        "ai_threat_model.api.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
+    parser = argparse.ArgumentParser(description="Run the AI Threat Model API server")
+    parser.add_argument("--host", default="0.0.0.0", help="Bind host")
+    parser.add_argument("--port", type=int, default=8000, help="Bind port")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="?",
+        const=os.cpu_count(),
+        default=None,
+        help="Run in production mode with N worker processes (default: CPU count)",
     )
+    args = parser.parse_args()
+
+    if args.workers:
+        # Production: reload is incompatible with multiple workers
+        uvicorn.run(
+            "ai_threat_model.api.main:app",
+            host=args.host,
+            port=args.port,
+            loop="uvloop",
+            http="httptools",
+            workers=args.workers,
+        )
+    else:
+        # Development: single process with auto-reload
+        uvicorn.run(
+            "ai_threat_model.api.main:app",
+            host=args.host,
+            port=args.port,
+            reload=True,
+            loop="uvloop",
+            http="httptools",
+        )
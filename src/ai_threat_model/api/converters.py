@@ -4,7 +4,7 @@ Converters for vision analysis results to threat models.
 
 from typing import List, Optional
 
-from ...core.models import (
+from ..core.models import (
     Component,
     ComponentType,
     DataClassification,
@@ -18,6 +18,24 @@ from ...core.models import (
 )
 from .models import VisionAnalysisResponse
 
+# Value -> member lookup tables, built once so request handling does a dict
+# lookup instead of calling the Enum constructor inside try/except.
+SYSTEM_TYPE_BY_VALUE = {m.value: m for m in SystemType}
+FRAMEWORK_BY_VALUE = {m.value: m for m in ThreatModelingFramework}
+DATA_CLASSIFICATION_BY_VALUE = {m.value: m for m in DataClassification}
+COMPONENT_TYPE_BY_VALUE = {
+    **{m.value: m for m in ComponentType},
+    # Aliases commonly returned by vision analysis
+    "api": ComponentType.API_ENDPOINT,
+}
+
+
+def _component_type(value: str) -> ComponentType:
+    """Map a vision component type to ComponentType, accepting aliases and any casing."""
+    return COMPONENT_TYPE_BY_VALUE.get(value) or COMPONENT_TYPE_BY_VALUE.get(
+        value.lower(), ComponentType.DATABASE
+    )
+
 
 def vision_response_to_threat_model(
     vision_response: VisionAnalysisResponse,
@@ -40,68 +58,35 @@ def vision_response_to_threat_model(
     # Determine system name
     name = system_name or vision_response.suggested_system_name or "Untitled System"
     
-    # Determine system type
-    if system_type:
-        try:
-            sys_type = SystemType(system_type)
-        except ValueError:
-            sys_type = SystemType.LLM_APP  # Default
-    elif vision_response.suggested_system_type:
-        try:
-            sys_type = SystemType(vision_response.suggested_system_type)
-        except ValueError:
-            sys_type = SystemType.LLM_APP  # Default
-    else:
-        sys_type = SystemType.LLM_APP  # Default
+    # Determine system type ("" is never a key, so a missing value falls back)
+    sys_type = SYSTEM_TYPE_BY_VALUE.get(
+        system_type or vision_response.suggested_system_type or "", SystemType.LLM_APP
+    )
     
     # Determine framework
-    if framework:
-        try:
-            framework_enum = ThreatModelingFramework(framework)
-        except ValueError:
-            framework_enum = ThreatModelingFramework.OWASP_LLM_TOP10_2025  # Default
-    elif vision_response.suggested_framework:
-        try:
-            framework_enum = ThreatModelingFramework(vision_response.suggested_framework)
-        except ValueError:
-            framework_enum = ThreatModelingFramework.OWASP_LLM_TOP10_2025  # Default
-    else:
-        framework_enum = ThreatModelingFramework.OWASP_LLM_TOP10_2025  # Default
+    framework_enum = FRAMEWORK_BY_VALUE.get(
+        framework or vision_response.suggested_framework or "",
+        ThreatModelingFramework.OWASP_LLM_TOP10_2025,
+    )
     
-    # Convert components
+    # Convert components. The vision data comes from an LLM, so every model is
+    # built through validation.
+    to_component_type = _component_type
+    internal = TrustLevel.INTERNAL
     components = []
     component_id_map = {}  # Map original IDs to Component objects
-    
-    for comp_data in vision_response.components:
-        comp_id = comp_data.get("id", f"comp-{len(components)}")
-        comp_name = comp_data.get("name", "Unnamed Component")
-        comp_type_str = comp_data.get("type", "database")
-        
-        # Try to map to ComponentType
-        try:
-            comp_type = ComponentType(comp_type_str)
-        except ValueError:
-            # Fallback mapping
-            comp_type_map = {
-                "llm": ComponentType.LLM,
-                "agent": ComponentType.AGENT,
-                "tool": ComponentType.TOOL,
-                "memory": ComponentType.MEMORY,
-                "database": ComponentType.DATABASE,
-                "api": ComponentType.API_ENDPOINT,
-                "web-server": ComponentType.WEB_SERVER,
-            }
-            comp_type = comp_type_map.get(comp_type_str.lower(), ComponentType.DATABASE)
-        
+
+    for i, comp_data in enumerate(vision_response.components):
+        comp_id = comp_data.get("id", f"comp-{i}")
         component = Component(
             id=comp_id,
-            name=comp_name,
-            type=comp_type,
+            name=comp_data.get("name", "Unnamed Component"),
+            type=to_component_type(comp_data.get("type", "database")),
             description=comp_data.get("description"),
-            trust_level=TrustLevel.INTERNAL,  # Default
+            trust_level=internal,  # Default
             capabilities=[],  # Empty for now
         )
-        
+
         components.append(component)
         component_id_map[comp_id] = component
     
@@ -117,11 +102,9 @@ def vision_response_to_threat_model(
             continue
         
         # Determine classification
-        classification_str = flow_data.get("classification", "internal")
-        try:
-            classification = DataClassification(classification_str)
-        except ValueError:
-            classification = DataClassification.INTERNAL
+        classification = DATA_CLASSIFICATION_BY_VALUE.get(
+            flow_data.get("classification", "internal"), DataClassification.INTERNAL
+        )
         
         data_flow = DataFlow(
             from_component=from_id,
@@ -4,17 +4,44 @@ FastAPI application for AI Threat Model.
 Provides REST API endpoints for threat modeling operations and image analysis.
 """
 
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
+from ..plugins import load_plugins
 from .routes import patterns, threat_models, vision
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Register plugins and index threat models before serving requests."""
+    load_plugins()
+    await threat_models.refresh_index()
+
+    # Keep the threat model index in sync with files edited outside the API
+    stop_watching = asyncio.Event()
+    watcher = asyncio.create_task(threat_models.watch_examples(stop_watching))
+    yield
+    stop_watching.set()
+    await watcher
+
+
 app = FastAPI(
     title="AI Threat Model API",
     description="Open-source threat modeling tool for AI-native systems",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
+# Compress larger JSON responses. Added before CORS so CORS stays outermost.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # CORS middleware for frontend
 app.add_middleware(
     CORSMiddleware,
@@ -4,76 +4,85 @@ Pattern API routes.
 Provides endpoints for threat patterns.
 """
 
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 
-from ...core.models import ThreatModelingFramework
-from ...plugins import load_plugins
+from ...core.models import SystemType, ThreatModelingFramework
+from ...plugins.base_plugin import ThreatModelPlugin
 from ...plugins.registry import PluginRegistry
+from ..converters import FRAMEWORK_BY_VALUE
 from ..models import PatternResponse
 
 router = APIRouter()
 
-# Load plugins on startup
-load_plugins()
+
+PatternIndex = Tuple[
+    Dict[Optional[ThreatModelingFramework], List[dict]],
+    Dict[str, dict],
+]
+
+
+def _pattern_index() -> PatternIndex:
+    """Return the pattern index for the currently registered plugins."""
+    return _build_pattern_index(tuple(PluginRegistry.list_plugins().items()))
+
+
+@lru_cache(maxsize=1)
+def _build_pattern_index(
+    plugins: Tuple[Tuple[SystemType, ThreatModelPlugin], ...],
+) -> PatternIndex:
+    """
+    Build the pattern responses once per set of registered plugins.
+
+    A plugin's patterns do not change once it is loaded, so the responses are
+    validated and dumped once, then indexed by framework (None holds every
+    pattern) and by pattern ID. The cache is keyed on the registry contents,
+    so an index built before plugins are loaded is rebuilt once they are.
+    """
+    by_framework: Dict[Optional[ThreatModelingFramework], List[dict]] = {None: []}
+    by_id: Dict[str, dict] = {}
+
+    for system_type, plugin in plugins:
+        for pattern in plugin.get_threat_patterns():
+            response = PatternResponse(
+                id=pattern.id,
+                category=pattern.category,
+                framework=pattern.framework.value,
+                title=pattern.title,
+                description=pattern.description,
+                system_type=system_type.value,
+            ).model_dump()
+            by_framework[None].append(response)
+            by_framework.setdefault(pattern.framework, []).append(response)
+            # First plugin to provide an ID wins, as in a sequential search
+            by_id.setdefault(pattern.id, response)
+
+    return by_framework, by_id
 
 
 @router.get("/", response_model=List[PatternResponse])
 async def list_patterns(framework: Optional[str] = None):
     """List all threat patterns."""
-    patterns = []
-    
-    # Get all registered plugins
-    for system_type in PluginRegistry.list_system_types():
-        plugin = PluginRegistry.get_plugin(system_type)
-        if not plugin:
-            continue
-        
-        # Filter by framework if provided
-        framework_enum = None
-        if framework:
-            try:
-                framework_enum = ThreatModelingFramework(framework)
-            except ValueError:
-                raise HTTPException(status_code=400, detail=f"Invalid framework: {framework}")
-        
-        plugin_patterns = plugin.get_threat_patterns(framework_enum)
-        
-        for pattern in plugin_patterns:
-            patterns.append(
-                PatternResponse(
-                    id=pattern.id,
-                    category=pattern.category,
-                    framework=pattern.framework.value,
-                    title=pattern.title,
-                    description=pattern.description,
-                    system_type=system_type.value,
-                )
-            )
-    
-    return patterns
+    # Filter by framework if provided
+    framework_enum = None
+    if framework:
+        framework_enum = FRAMEWORK_BY_VALUE.get(framework)
+        if framework_enum is None:
+            raise HTTPException(status_code=400, detail=f"Invalid framework: {framework}")
+
+    # Entries were validated when the index was built; skip response_model
+    by_framework, _ = _pattern_index()
+    return ORJSONResponse(by_framework.get(framework_enum, []))
 
 
 @router.get("/{pattern_id}", response_model=PatternResponse)
 async def get_pattern(pattern_id: str):
     """Get a specific threat pattern."""
-    # Search through all plugins
-    for system_type in PluginRegistry.list_system_types():
-        plugin = PluginRegistry.get_plugin(system_type)
-        if not plugin:
-            continue
-        
-        patterns = plugin.get_threat_patterns()
-        for pattern in patterns:
-            if pattern.id == pattern_id:
-                return PatternResponse(
-                    id=pattern.id,
-                    category=pattern.category,
-                    framework=pattern.framework.value,
-                    title=pattern.title,
-                    description=pattern.description,
-                    system_type=system_type.value,
-                )
-    
-    raise HTTPException(status_code=404, detail="Pattern not found")
+    _, by_id = _pattern_index()
+    pattern = by_id.get(pattern_id)
+    if pattern is None:
+        raise HTTPException(status_code=404, detail="Pattern not found")
+    return ORJSONResponse(pattern)
@@ -4,20 +4,23 @@ Threat model API routes.
 Provides endpoints for CRUD operations on threat models.
 """
 
+import asyncio
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, HTTPException, UploadFile, File as FastAPIFile
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel
+from watchfiles import awatch
 
 from ...core.models import ThreatModel
-from ...plugins import load_plugins
 from ...plugins.registry import PluginRegistry
+from ..converters import FRAMEWORK_BY_VALUE, SYSTEM_TYPE_BY_VALUE
 
 router = APIRouter()
 
-# Load plugins on startup
-load_plugins()
+# For now, threat models are stored in the repository's examples directory
+_EXAMPLES_DIR = Path(__file__).resolve().parents[4] / "examples"
 
 
 class ThreatModelResponse(BaseModel):
@@ -39,49 +42,101 @@ class ThreatModelCreate(BaseModel):
     description: Optional[str] = None
 
 
+# Current list entries keyed by file path, with the (mtime_ns, size) they were
+# read at; kept up to date by watch_examples() and the endpoints that write files
+_INDEX: Dict[str, Tuple[int, int, ThreatModelResponse]] = {}
+
+
+def _summarize(file_path: Path) -> Optional[Tuple[int, int, ThreatModelResponse]]:
+    """Build the index entry for a threat model file, or None if it can't be loaded."""
+    try:
+        stat = file_path.stat()
+        # Reuse the indexed entry while the file is unchanged
+        cached = _INDEX.get(str(file_path))
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached
+
+        threat_model = ThreatModel.load(str(file_path))
+        response = ThreatModelResponse.model_construct(
+            id=file_path.name[: -len(".tm.json")],
+            name=threat_model.system.name,
+            system_type=threat_model.system.type.value,
+            framework=threat_model.system.threat_modeling_framework.value,
+            component_count=len(threat_model.system.components),
+            data_flow_count=len(threat_model.system.data_flows),
+            threat_count=len(threat_model.threats),
+        )
+        return stat.st_mtime_ns, stat.st_size, response
+    except Exception:
+        return None
+
+
+def _set_index_entry(
+    file_path: Path, entry: Optional[Tuple[int, int, ThreatModelResponse]]
+) -> None:
+    """Store an index entry, dropping deleted or unreadable files from the index."""
+    if entry is None:
+        _INDEX.pop(str(file_path), None)
+    else:
+        _INDEX[str(file_path)] = entry
+
+
+def _index_file(file_path: Path) -> None:
+    """Add, update or drop the index entry for a single threat model file."""
+    _set_index_entry(file_path, _summarize(file_path))
+
+
+async def _summarize_all(
+    paths: List[Path],
+) -> List[Optional[Tuple[int, int, ThreatModelResponse]]]:
+    """Load several threat model files concurrently in worker threads."""
+    return await asyncio.gather(*(asyncio.to_thread(_summarize, path) for path in paths))
+
+
+async def refresh_index() -> None:
+    """Rebuild the threat model index from the examples directory."""
+    paths = list(_EXAMPLES_DIR.glob("*.tm.json")) if _EXAMPLES_DIR.exists() else []
+    entries = await _summarize_all(paths)
+
+    _INDEX.clear()
+    for file_path, entry in zip(paths, entries):
+        _set_index_entry(file_path, entry)
+
+
+async def watch_examples(stop_event: asyncio.Event) -> None:
+    """Keep the index in sync with the examples directory until stop_event is set."""
+    if not _EXAMPLES_DIR.exists():
+        return
+    
+    async for changes in awatch(
+        _EXAMPLES_DIR,
+        watch_filter=lambda change, path: path.endswith(".tm.json"),
+        stop_event=stop_event,
+    ):
+        paths = [Path(path) for path in {path for _, path in changes}]
+        for file_path, entry in zip(paths, await _summarize_all(paths)):
+            _set_index_entry(file_path, entry)
+
+
 @router.get("/", response_model=List[ThreatModelResponse])
 async def list_threat_models(directory: Optional[str] = None):
     """List all threat models."""
-    # For now, scan examples directory
+    # For now, serve the examples directory index built at startup
     # In production, this would query a database
-    examples_dir = Path(__file__).parent.parent.parent.parent.parent / "examples"
-    
-    if not examples_dir.exists():
-        return []
-    
-    models = []
-    for file_path in examples_dir.glob("*.tm.json"):
-        try:
-            threat_model = ThreatModel.load(str(file_path))
-            models.append(
-                ThreatModelResponse(
-                    id=file_path.stem,
-                    name=threat_model.system.name,
-                    system_type=threat_model.system.type.value,
-                    framework=threat_model.system.threat_modeling_framework.value,
-                    component_count=len(threat_model.system.components),
-                    data_flow_count=len(threat_model.system.data_flows),
-                    threat_count=len(threat_model.threats),
-                )
-            )
-        except Exception:
-            continue
-    
-    return models
+    return [response for _, _, response in _INDEX.values()]
 
 
-@router.get("/{model_id}", response_model=dict)
+@router.get("/{model_id}")
 async def get_threat_model(model_id: str):
     """Get a specific threat model."""
-    examples_dir = Path(__file__).parent.parent.parent.parent.parent / "examples"
-    file_path = examples_dir / f"{model_id}.tm.json"
+    file_path = _EXAMPLES_DIR / f"{model_id}.tm.json"
     
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="Threat model not found")
     
     try:
         threat_model = ThreatModel.load(str(file_path))
-        return threat_model.model_dump()
+        return ORJSONResponse(threat_model.model_dump(mode="json"))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error loading threat model: {str(e)}")
 
@@ -89,13 +144,15 @@ async def get_threat_model(model_id: str):
 @router.post("/", response_model=dict)
 async def create_threat_model(data: ThreatModelCreate):
     """Create a new threat model."""
-    from ...core.models import SystemModel, SystemType, ThreatModelingFramework, Metadata
+    from ...core.models import SystemModel, Metadata
     
-    try:
-        system_type = SystemType(data.system_type)
-        framework = ThreatModelingFramework(data.framework)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=f"Invalid system type or framework: {str(e)}")
+    system_type = SYSTEM_TYPE_BY_VALUE.get(data.system_type)
+    framework = FRAMEWORK_BY_VALUE.get(data.framework)
+    if system_type is None or framework is None:
+        invalid = data.system_type if system_type is None else data.framework
+        raise HTTPException(
+            status_code=400, detail=f"Invalid system type or framework: {invalid}"
+        )
     
     threat_model = ThreatModel(
         metadata=Metadata(version="1.0.0"),
@@ -110,14 +167,13 @@ async def create_threat_model(data: ThreatModelCreate):
         threats=[],
     )
     
-    return threat_model.model_dump()
+    return ORJSONResponse(threat_model.model_dump(mode="json"))
 
 
 @router.post("/{model_id}/analyze", response_model=dict)
 async def analyze_threat_model(model_id: str):
     """Analyze a threat model and detect threats."""
-    examples_dir = Path(__file__).parent.parent.parent.parent.parent / "examples"
-    file_path = examples_dir / f"{model_id}.tm.json"
+    file_path = _EXAMPLES_DIR / f"{model_id}.tm.json"
     
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="Threat model not found")
@@ -139,8 +195,11 @@ async def analyze_threat_model(model_id: str):
         
         # Save updated model
         threat_model.save(str(file_path))
+        _index_file(file_path)
         
-        return threat_model.model_dump()
+        # Serialize straight to JSON bytes; the file uses "from"/"to" aliases
+        # while the frontend expects field names, so the two can't share bytes
+        return Response(threat_model.model_dump_json(), media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
@@ -150,8 +209,7 @@ async def analyze_threat_model(model_id: str):
 @router.put("/{model_id}", response_model=dict)
 async def update_threat_model(model_id: str, threat_model_data: dict):
     """Update a threat model."""
-    examples_dir = Path(__file__).parent.parent.parent.parent.parent / "examples"
-    file_path = examples_dir / f"{model_id}.tm.json"
+    file_path = _EXAMPLES_DIR / f"{model_id}.tm.json"
     
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="Threat model not found")
@@ -159,7 +217,8 @@ async def update_threat_model(model_id: str, threat_model_data: dict):
     try:
         threat_model = ThreatModel(**threat_model_data)
         threat_model.save(str(file_path))
-        return threat_model.model_dump()
+        _index_file(file_path)
+        return Response(threat_model.model_dump_json(), media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error updating threat model: {str(e)}")
 
@@ -167,14 +226,14 @@ async def update_threat_model(model_id: str, threat_model_data: dict):
 @router.delete("/{model_id}")
 async def delete_threat_model(model_id: str):
     """Delete a threat model."""
-    examples_dir = Path(__file__).parent.parent.parent.parent.parent / "examples"
-    file_path = examples_dir / f"{model_id}.tm.json"
+    file_path = _EXAMPLES_DIR / f"{model_id}.tm.json"
     
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="Threat model not found")
     
     try:
         file_path.unlink()
+        _index_file(file_path)
         return {"message": "Threat model deleted successfully"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error deleting threat model: {str(e)}")
@@ -4,21 +4,43 @@ Vision analysis API routes.
 Provides endpoints for analyzing images/diagrams and converting them to threat models.
 """
 
-import base64
+import binascii
 import io
-from typing import Optional
+from typing import BinaryIO, Optional
 
 from fastapi import APIRouter, HTTPException, UploadFile, File as FastAPIFile
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from PIL import Image
 
-from ...core.models import SystemType, ThreatModelingFramework
-from ..converters import vision_response_to_threat_model
+from ..converters import (
+    FRAMEWORK_BY_VALUE,
+    SYSTEM_TYPE_BY_VALUE,
+    vision_response_to_threat_model,
+)
 from ..models import VisionAnalysisResponse
 from ..vision import analyze_image_with_vision
 
 router = APIRouter()
 
 
+def _decode_image(fp: BinaryIO) -> Image.Image:
+    """Decode an image file object into a fully loaded PIL Image (blocking)."""
+    image = Image.open(fp)
+    image.load()
+    # Convert RGBA to RGB if needed
+    if image.mode == "RGBA":
+        image = image.convert("RGB")
+    return image
+
+
+def _decode_base64_image(image_data: str) -> Image.Image:
+    """Decode a base64 string or data URL into a PIL Image (blocking)."""
+    # Strip any "data:image/...;base64," prefix
+    _, _, payload = image_data.rpartition(",")
+    return _decode_image(io.BytesIO(binascii.a2b_base64(payload)))
+
+
 @router.post("/analyze", response_model=VisionAnalysisResponse)
 async def analyze_image(
     file: UploadFile = FastAPIFile(...),
@@ -38,31 +60,23 @@ async def analyze_image(
             detail=f"Unsupported file type: {file.content_type}. Supported types: {allowed_types}",
         )
     
-    # Read file content
-    file_content = await file.read()
-    
-    # Convert to image if needed
+    # Decode straight from the spooled upload file, without copying it to bytes
     try:
-        image = Image.open(io.BytesIO(file_content))
-        # Convert RGBA to RGB if needed
-        if image.mode == "RGBA":
-            image = image.convert("RGB")
+        image = await run_in_threadpool(_decode_image, file.file)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error processing image: {str(e)}")
     
     # Parse system type and framework
     system_type_enum = None
     if system_type:
-        try:
-            system_type_enum = SystemType(system_type)
-        except ValueError:
+        system_type_enum = SYSTEM_TYPE_BY_VALUE.get(system_type)
+        if system_type_enum is None:
             raise HTTPException(status_code=400, detail=f"Invalid system type: {system_type}")
     
     framework_enum = None
     if framework:
-        try:
-            framework_enum = ThreatModelingFramework(framework)
-        except ValueError:
+        framework_enum = FRAMEWORK_BY_VALUE.get(framework)
+        if framework_enum is None:
             raise HTTPException(status_code=400, detail=f"Invalid framework: {framework}")
     
     # Analyze image with vision API
@@ -85,29 +99,21 @@ async def analyze_image_base64(
     Useful for frontend applications that convert images to base64.
     """
     try:
-        # Decode base64
-        image_bytes = base64.b64decode(image_data.split(",")[-1] if "," in image_data else image_data)
-        image = Image.open(io.BytesIO(image_bytes))
-        
-        # Convert RGBA to RGB if needed
-        if image.mode == "RGBA":
-            image = image.convert("RGB")
+        image = await run_in_threadpool(_decode_base64_image, image_data)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error processing image: {str(e)}")
     
     # Parse system type and framework
     system_type_enum = None
     if system_type:
-        try:
-            system_type_enum = SystemType(system_type)
-        except ValueError:
+        system_type_enum = SYSTEM_TYPE_BY_VALUE.get(system_type)
+        if system_type_enum is None:
             raise HTTPException(status_code=400, detail=f"Invalid system type: {system_type}")
     
     framework_enum = None
     if framework:
-        try:
-            framework_enum = ThreatModelingFramework(framework)
-        except ValueError:
+        framework_enum = FRAMEWORK_BY_VALUE.get(framework)
+        if framework_enum is None:
             raise HTTPException(status_code=400, detail=f"Invalid framework: {framework}")
     
     # Analyze image with vision API
@@ -135,7 +141,7 @@ async def convert_vision_to_threat_model(
         threat_model = vision_response_to_threat_model(
             vision_response, system_name, system_type, framework
         )
-        return threat_model.model_dump()
+        return ORJSONResponse(threat_model.model_dump(mode="json"))
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Error converting to threat model: {str(e)}"
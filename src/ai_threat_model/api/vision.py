@@ -5,18 +5,22 @@ Uses OpenAI GPT-4 Vision to analyze diagrams and extract threat model components
 """
 
 import io
-import json
 import os
-from typing import List, Optional
+from typing import Optional
 
-from openai import OpenAI
+import orjson
+from fastapi.concurrency import run_in_threadpool
+from openai import AsyncOpenAI
 from PIL import Image
 
-from ...core.models import ComponentType, SystemType, ThreatModelingFramework
+from ..core.models import SystemType, ThreatModelingFramework
 from .models import VisionAnalysisResponse
 
 # Initialize OpenAI client
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+# Longest edge sent to the vision model; it does not use detail beyond this
+MAX_IMAGE_EDGE = 2048
 
 
 async def analyze_image_with_vision(
@@ -26,26 +30,24 @@ async def analyze_image_with_vision(
 ) -> VisionAnalysisResponse:
     """
     Analyze an image using GPT-4 Vision and extract threat model components.
-    
+
     Args:
         image: PIL Image object
         system_type: Optional system type hint
         framework: Optional framework hint
-        
+
     Returns:
         VisionAnalysisResponse with extracted components and data flows
     """
-    # Convert image to bytes
-    img_byte_arr = io.BytesIO()
-    image.save(img_byte_arr, format="PNG")
-    img_byte_arr.seek(0)
-    
+    # Encode image once for the data URL, off the event loop
+    image_url = await run_in_threadpool(_image_to_data_url, image)
+
     # Build prompt
     prompt = _build_analysis_prompt(system_type, framework)
-    
+
     # Call OpenAI Vision API
     try:
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model="gpt-4o",
             messages=[
                 {
@@ -59,7 +61,8 @@ async def analyze_image_with_vision(
                         {
                             "type": "image_url",
                             "image_url": {
-                                "url": f"data:image/png;base64,{_image_to_base64(image)}"
+                                "url": image_url,
+                                "detail": "high",
                             },
                         },
                     ],
@@ -68,10 +71,10 @@ async def analyze_image_with_vision(
             max_tokens=2000,
             response_format={"type": "json_object"},
         )
-        
+
         # Parse response
-        result = json.loads(response.choices[0].message.content)
-        
+        result = orjson.loads(response.choices[0].message.content or "{}")
+
         # Extract components and data flows
         components = result.get("components", [])
         data_flows = result.get("data_flows", [])
@@ -80,7 +83,7 @@ async def analyze_image_with_vision(
         suggested_framework = result.get("framework")
         confidence = result.get("confidence", 0.5)
         raw_analysis = result.get("analysis", "")
-        
+
         return VisionAnalysisResponse(
             components=components,
             data_flows=data_flows,
@@ -94,12 +97,8 @@ async def analyze_image_with_vision(
         raise Exception(f"Error calling vision API: {str(e)}")
 
 
-def _build_analysis_prompt(
-    system_type: Optional[SystemType] = None,
-    framework: Optional[ThreatModelingFramework] = None,
-) -> str:
-    """Build the analysis prompt for vision API."""
-    prompt = """Analyze this system architecture diagram and extract the following information:
+# Base analysis prompt; only the optional hints vary per request
+_BASE_PROMPT = """Analyze this system architecture diagram and extract the following information:
 
 1. **Components**: Identify all components (services, databases, APIs, agents, LLMs, tools, etc.)
    - For each component, extract: name, type, description (if visible)
@@ -142,21 +141,44 @@ Important:
 - For classification, default to "internal" if not visible
 - For encrypted, default to false if not visible
 - Be thorough but accurate - only extract what you can clearly see"""
-    
+
+
+def _build_analysis_prompt(
+    system_type: Optional[SystemType] = None,
+    framework: Optional[ThreatModelingFramework] = None,
+) -> str:
+    """Build the analysis prompt for vision API."""
+    parts = [_BASE_PROMPT]
+
     if system_type:
-        prompt += f"\n\nHint: The system type is likely: {system_type.value}"
-    
+        parts.append(f"\n\nHint: The system type is likely: {system_type.value}")
+
     if framework:
-        prompt += f"\n\nHint: The framework is likely: {framework.value}"
-    
-    return prompt
+        parts.append(f"\n\nHint: The framework is likely: {framework.value}")
 
+    return "".join(parts)
 
-def _image_to_base64(image: Image.Image) -> str:
-    """Convert PIL Image to base64 string."""
+
+def _image_to_data_url(image: Image.Image) -> str:
+    """
+    Encode PIL Image as a base64 data URL.
+
+    Images larger than MAX_IMAGE_EDGE are downscaled first. JPEG sources are
+    re-encoded as JPEG, which is much cheaper than PNG; everything else stays
+    PNG so diagrams keep their sharp edges.
+    """
     import base64
-    
+
+    if image.format == "JPEG":
+        image_format, mime_type, save_kwargs = "JPEG", "image/jpeg", {"quality": 85}
+    else:
+        image_format, mime_type, save_kwargs = "PNG", "image/png", {}
+
+    if max(image.size) > MAX_IMAGE_EDGE:
+        image = image.copy()
+        image.thumbnail((MAX_IMAGE_EDGE, MAX_IMAGE_EDGE), Image.Resampling.LANCZOS)
+
     img_byte_arr = io.BytesIO()
-    image.save(img_byte_arr, format="PNG")
-    img_byte_arr.seek(0)
-    return base64.b64encode(img_byte_arr.read()).decode("utf-8")
+    image.save(img_byte_arr, format=image_format, **save_kwargs)
+    encoded = base64.b64encode(img_byte_arr.getbuffer()).decode("ascii")
+    return f"data:{mime_type};base64,{encoded}"
@@ -0,0 +1,9 @@
+"""
+Shared Rich console for the CLI.
+"""
+
+from rich.console import Console
+
+# One console for all CLI output. Highlighting is off because status lines
+# carry explicit markup, and soft wrapping keeps long paths on one line.
+console = Console(highlight=False, soft_wrap=True)
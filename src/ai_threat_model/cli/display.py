@@ -4,60 +4,112 @@ Display utilities for threat models.
 Provides helper functions for displaying threat models in human-readable format.
 """
 
-from typing import List
+from dataclasses import dataclass
+from itertools import islice
+from operator import attrgetter
+from typing import Dict, List, Tuple
 
-from rich.console import Console
+from rich.console import Group, RenderableType
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 
-from ..core.models import DataFlow, SystemModel, Threat, ThreatModel
+from ..core.models import Component, DataFlow, SystemModel, Threat, ThreatModel
+from ._console import console
 
-console = Console()
+
+# Equivalent of a bare console.print() inside a Group
+_BLANK = ""
+
+# Panel border color per severity level
+_SEVERITY_COLORS = {
+    "critical": "red",
+    "high": "yellow",
+    "medium": "blue",
+    "low": "green",
+}
+
+
+@dataclass
+class _ResolvedThreat:
+    """Display names of a threat's affected items, resolved once per threat."""
+
+    comp_names: List[str]
+    flow_names: List[str]
+    affected_summary: str
 
 
 def display_threat_model(threat_model: ThreatModel) -> None:
     """Display threat model in human-readable format."""
-    _display_header(threat_model)
-    _display_metadata(threat_model)
-    _display_components(threat_model)
-    _display_data_flows(threat_model)
-    _display_threats(threat_model)
-    _display_summary(threat_model)
+    comp_by_id, flow_by_key = _index_system(threat_model.system)
 
-
-def _display_header(threat_model: ThreatModel) -> None:
-    """Display threat model header."""
-    console.print()
+    # Render everything into one group so the console writes it in a single pass.
+    # Tables and panels need regular wrapping to lay out their titles.
     console.print(
+        Group(
+            *_render_header(threat_model),
+            *_render_metadata(threat_model),
+            *_render_components(threat_model),
+            *_render_data_flows(threat_model, comp_by_id),
+            *_render_threats(threat_model, comp_by_id, flow_by_key),
+            *_render_summary(threat_model),
+        ),
+        soft_wrap=False,
+    )
+
+
+def _index_system(
+    system: SystemModel,
+) -> Tuple[Dict[str, Component], Dict[str, DataFlow]]:
+    """Index components by ID and data flows by "from->to" key."""
+    # The first entry wins on duplicates, as with a linear scan
+    comp_by_id: Dict[str, Component] = {}
+    for component in system.components:
+        comp_by_id.setdefault(component.id, component)
+
+    flow_by_key: Dict[str, DataFlow] = {}
+    for df in system.data_flows:
+        flow_by_key.setdefault(f"{df.from_component}->{df.to_component}", df)
+
+    return comp_by_id, flow_by_key
+
+
+def _render_header(threat_model: ThreatModel) -> List[RenderableType]:
+    """Render threat model header."""
+    return [
+        _BLANK,
         Panel(
             f"[bold cyan]{threat_model.system.name}[/bold cyan]",
             title="Threat Model",
             border_style="cyan",
-        )
-    )
+        ),
+    ]
+
+
+def _render_metadata(threat_model: ThreatModel) -> List[RenderableType]:
+    """Render threat model metadata."""
+    metadata = threat_model.metadata
+    rows = [
+        ("[bold]System Type:[/bold]", threat_model.system.type.value),
+        ("[bold]Framework:[/bold]", threat_model.system.threat_modeling_framework.value),
+    ]
+    if metadata.author:
+        rows.append(("[bold]Author:[/bold]", metadata.author))
+    if metadata.created:
+        rows.append(("[bold]Created:[/bold]", f"{metadata.created!s:.19}"))
+    if metadata.updated:
+        rows.append(("[bold]Updated:[/bold]", f"{metadata.updated!s:.19}"))
 
-
-def _display_metadata(threat_model: ThreatModel) -> None:
-    """Display threat model metadata."""
     meta_table = Table.grid(padding=(0, 2))
-    meta_table.add_row("[bold]System Type:[/bold]", threat_model.system.type.value)
-    meta_table.add_row(
-        "[bold]Framework:[/bold]", threat_model.system.threat_modeling_framework.value
-    )
-    if threat_model.metadata.author:
-        meta_table.add_row("[bold]Author:[/bold]", threat_model.metadata.author)
-    if threat_model.metadata.created:
-        meta_table.add_row("[bold]Created:[/bold]", str(threat_model.metadata.created)[:19])
-    if threat_model.metadata.updated:
-        meta_table.add_row("[bold]Updated:[/bold]", str(threat_model.metadata.updated)[:19])
-    console.print(meta_table)
-    console.print()
-
-
-def _display_components(threat_model: ThreatModel) -> None:
-    """Display components table."""
+    for label, value in rows:
+        meta_table.add_row(label, value)
+    return [meta_table, _BLANK]
+
+
+def _render_components(threat_model: ThreatModel) -> List[RenderableType]:
+    """Render components table."""
     if not threat_model.system.components:
-        return
+        return []
 
     components_table = Table(title="Components", show_header=True, header_style="bold magenta")
     components_table.add_column("ID", style="cyan", width=20)
@@ -65,22 +117,20 @@ def _display_components(threat_model: ThreatModel) -> None:
     components_table.add_column("Type", style="yellow", width=20)
     components_table.add_column("Trust Level", style="blue", width=15)
 
+    # Resolve all row fields, including the enum values, in one C-level call
+    component_row = attrgetter("id", "name", "type.value", "trust_level.value")
     for component in threat_model.system.components:
-        components_table.add_row(
-            component.id,
-            component.name,
-            component.type.value,
-            component.trust_level.value,
-        )
+        components_table.add_row(*component_row(component))
 
-    console.print(components_table)
-    console.print()
+    return [components_table, _BLANK]
 
 
-def _display_data_flows(threat_model: ThreatModel) -> None:
-    """Display data flows table."""
+def _render_data_flows(
+    threat_model: ThreatModel, comp_by_id: Dict[str, Component]
+) -> List[RenderableType]:
+    """Render data flows table."""
     if not threat_model.system.data_flows:
-        return
+        return []
 
     flows_table = Table(title="Data Flows", show_header=True, header_style="bold magenta")
     flows_table.add_column("From", style="cyan", width=20)
@@ -89,72 +139,99 @@ def _display_data_flows(threat_model: ThreatModel) -> None:
     flows_table.add_column("Classification", style="blue", width=15)
     flows_table.add_column("Encrypted", style="green", width=10)
 
+    get_classification = attrgetter("classification.value")
     for df in threat_model.system.data_flows:
-        from_name, to_name = _get_data_flow_names(df, threat_model.system)
+        from_name, to_name = _get_data_flow_names(df, comp_by_id)
         flows_table.add_row(
             from_name,
             to_name,
             df.data_type or "N/A",
-            df.classification.value,
+            get_classification(df),
             "✓" if df.encrypted else "✗",
         )
 
-    console.print(flows_table)
-    console.print()
+    return [flows_table, _BLANK]
 
 
-def _display_threats(threat_model: ThreatModel) -> None:
-    """Display threats table and detailed panels."""
+def _render_threats(
+    threat_model: ThreatModel,
+    comp_by_id: Dict[str, Component],
+    flow_by_key: Dict[str, DataFlow],
+) -> List[RenderableType]:
+    """Render threats table and detailed panels."""
     if not threat_model.threats:
-        console.print("[yellow]No threats identified yet. Run 'analyze' to detect threats.[/yellow]")
-        console.print()
-        return
+        return [
+            "[yellow]No threats identified yet. Run 'analyze' to detect threats.[/yellow]",
+            _BLANK,
+        ]
 
-    _display_threats_table(threat_model)
-    _display_threat_details(threat_model)
+    resolved = [
+        _resolve_threat(threat, comp_by_id, flow_by_key) for threat in threat_model.threats
+    ]
+    return [
+        *_render_threats_table(threat_model, resolved),
+        *_render_threat_details(threat_model, resolved),
+    ]
 
 
-def _display_threats_table(threat_model: ThreatModel) -> None:
-    """Display threats summary table."""
+def _render_threats_table(
+    threat_model: ThreatModel, resolved: List[_ResolvedThreat]
+) -> List[RenderableType]:
+    """Render threats summary table."""
     threats_table = Table(title="Threats", show_header=True, header_style="bold red")
     threats_table.add_column("Category", style="magenta", width=15)
     threats_table.add_column("Title", style="green", width=40)
     threats_table.add_column("Severity", style="yellow", width=12)
     threats_table.add_column("Affected Items", style="cyan", width=50)
 
-    for threat in threat_model.threats:
-        severity_str = threat.severity.value if threat.severity else "N/A"
-        affected_str = _format_affected_items(threat, threat_model.system)
-        threats_table.add_row(threat.category, threat.title, severity_str, affected_str)
-
-    console.print(threats_table)
-    console.print()
-
-
-def _display_threat_details(threat_model: ThreatModel) -> None:
-    """Display detailed threat information panels."""
-    for threat in threat_model.threats[:5]:  # Show first 5 in detail
-        panel_content = _build_threat_panel_content(threat, threat_model.system)
+    # Format every row in one pass, then hand them to the table
+    rows = [
+        (
+            threat.category,
+            threat.title,
+            threat.severity.value if threat.severity else "N/A",
+            names.affected_summary,
+        )
+        for threat, names in zip(threat_model.threats, resolved)
+    ]
+    for row in rows:
+        threats_table.add_row(*row)
+
+    return [threats_table, _BLANK]
+
+
+def _render_threat_details(
+    threat_model: ThreatModel, resolved: List[_ResolvedThreat]
+) -> List[RenderableType]:
+    """Render detailed threat information panels."""
+    renderables: List[RenderableType] = []
+    threats = threat_model.threats
+    threat_count = len(threats)
+    for threat, names in islice(zip(threats, resolved), 5):  # Show first 5 in detail
+        panel_content = _build_threat_panel_content(threat, names)
         # Always show panel if there's any content, or if we have basic threat info
         if panel_content or threat.category or threat.title:
-            severity_color = _get_severity_color(threat.severity.value if threat.severity else "medium")
+            severity_color = _SEVERITY_COLORS.get(
+                threat.severity.value if threat.severity else "medium", "white"
+            )
             # If no content, at least show category and title
             if not panel_content:
-                panel_content = [f"[bold]Category:[/bold] {threat.category}"]
-            console.print(
+                panel_content = [_labelled("Category", threat.category)]
+            renderables.append(
                 Panel(
-                    "\n".join(panel_content),
+                    Group(*panel_content),
                     title=f"{threat.category}: {threat.title}",
                     border_style=severity_color,
                 )
             )
 
-    if len(threat_model.threats) > 5:
-        console.print(f"\n[dim]... and {len(threat_model.threats) - 5} more threats[/dim]")
+    if threat_count > 5:
+        renderables.append(f"\n[dim]... and {threat_count - 5} more threats[/dim]")
+    return renderables
 
 
-def _display_summary(threat_model: ThreatModel) -> None:
-    """Display summary information."""
+def _render_summary(threat_model: ThreatModel) -> List[RenderableType]:
+    """Render summary information."""
     summary = Table.grid(padding=(0, 2))
     summary.add_row(
         "[bold]Summary:[/bold]",
@@ -162,40 +239,51 @@ def _display_summary(threat_model: ThreatModel) -> None:
         f"{len(threat_model.system.data_flows)} data flows, "
         f"{len(threat_model.threats)} threats",
     )
-    console.print(summary)
-    console.print()
+    return [summary, _BLANK]
 
 
-def _get_data_flow_names(data_flow: DataFlow, system: SystemModel) -> tuple[str, str]:
+def _get_data_flow_names(
+    data_flow: DataFlow, comp_by_id: Dict[str, Component]
+) -> tuple[str, str]:
     """Get component names for a data flow."""
-    from_comp = system.get_component(data_flow.from_component)
-    to_comp = system.get_component(data_flow.to_component)
+    from_comp = comp_by_id.get(data_flow.from_component)
+    to_comp = comp_by_id.get(data_flow.to_component)
     from_name = from_comp.name if from_comp else data_flow.from_component
     to_name = to_comp.name if to_comp else data_flow.to_component
     return from_name, to_name
 
 
-def _format_affected_items(threat: Threat, system: SystemModel) -> str:
-    """Format affected items list for display."""
-    affected_items = []
+def _resolve_threat(
+    threat: Threat,
+    comp_by_id: Dict[str, Component],
+    flow_by_key: Dict[str, DataFlow],
+) -> _ResolvedThreat:
+    """Resolve affected component and data flow names for a threat."""
+    comp_names = [
+        comp.name if (comp := comp_by_id.get(cid)) else cid
+        for cid in threat.affected_components
+    ]
+
+    flow_names = []
+    for df_id in threat.affected_data_flows:
+        df_found = _find_data_flow_by_id(df_id, flow_by_key)
+        if df_found:
+            from_name, to_name = _get_data_flow_names(df_found, comp_by_id)
+            flow_names.append(f"{from_name} → {to_name}")
+        else:
+            flow_names.append(df_id)
+
+    return _ResolvedThreat(
+        comp_names=comp_names,
+        flow_names=flow_names,
+        affected_summary=_format_affected_items(comp_names, flow_names),
+    )
 
-    # Add affected components
-    if threat.affected_components:
-        comp_names = [
-            system.get_component(cid).name if system.get_component(cid) else cid
-            for cid in threat.affected_components
-        ]
-        affected_items.extend([f"Component: {name}" for name in comp_names])
-
-    # Add affected data flows
-    if threat.affected_data_flows:
-        for df_id in threat.affected_data_flows:
-            df_found = _find_data_flow_by_id(df_id, system)
-            if df_found:
-                from_name, to_name = _get_data_flow_names(df_found, system)
-                affected_items.append(f"Flow: {from_name} → {to_name}")
-            else:
-                affected_items.append(f"Flow: {df_id}")
+
+def _format_affected_items(comp_names: List[str], flow_names: List[str]) -> str:
+    """Format affected items list for display."""
+    affected_items = [f"Component: {name}" for name in comp_names]
+    affected_items.extend(f"Flow: {name}" for name in flow_names)
 
     # Format for display
     if affected_items:
@@ -206,62 +294,47 @@ def _format_affected_items(threat: Threat, system: SystemModel) -> str:
     return "None specified"
 
 
-def _find_data_flow_by_id(df_id: str, system: SystemModel) -> DataFlow | None:
+def _find_data_flow_by_id(df_id: str, flow_by_key: Dict[str, DataFlow]) -> DataFlow | None:
     """Find data flow by ID string."""
-    for df in system.data_flows:
-        df_str = f"{df.from_component}->{df.to_component}"
-        if df_id == df_str or df_id in df_str:
-            return df
-    return None
+    # Exact "from->to" keys hit the dict; partial IDs fall back to a scan
+    return flow_by_key.get(df_id) or next(
+        (df for df_str, df in flow_by_key.items() if df_id in df_str), None
+    )
 
 
-def _build_threat_panel_content(threat: Threat, system: SystemModel) -> List[str]:
-    """Build content for threat detail panel."""
+def _build_threat_panel_content(threat: Threat, names: _ResolvedThreat) -> List[Text]:
+    """Build content lines for threat detail panel."""
     content = []
 
     if threat.description:
-        content.append(f"[bold]Description:[/bold] {threat.description}")
+        content.append(_labelled("Description", threat.description))
 
     # Affected Components
-    if threat.affected_components:
-        comp_names = [
-            system.get_component(cid).name if system.get_component(cid) else cid
-            for cid in threat.affected_components
-        ]
-        content.append(f"[bold]Affected Components:[/bold] {', '.join(comp_names)}")
+    if names.comp_names:
+        content.append(_labelled("Affected Components", ", ".join(names.comp_names)))
 
     # Affected Data Flows
-    if threat.affected_data_flows:
-        flow_descriptions = []
-        for df_id in threat.affected_data_flows:
-            df_found = _find_data_flow_by_id(df_id, system)
-            if df_found:
-                from_name, to_name = _get_data_flow_names(df_found, system)
-                flow_descriptions.append(f"{from_name} → {to_name}")
-            else:
-                flow_descriptions.append(df_id)
-        content.append(f"[bold]Affected Data Flows:[/bold] {', '.join(flow_descriptions)}")
+    if names.flow_names:
+        content.append(_labelled("Affected Data Flows", ", ".join(names.flow_names)))
 
     # Attack Vectors
     if threat.attack_vectors:
-        content.append(f"[bold]Attack Vectors:[/bold] {', '.join(threat.attack_vectors[:3])}")
+        content.append(_labelled("Attack Vectors", ", ".join(threat.attack_vectors[:3])))
 
     # Mitigations
     if threat.mitigations:
         mitigations_list = [f"- {m.description}" for m in threat.mitigations[:3]]
         content.append(
-            f"[bold]Mitigations ({len(threat.mitigations)}):[/bold]\n" + "\n".join(mitigations_list)
+            Text.assemble(
+                (f"Mitigations ({len(threat.mitigations)}):", "bold"),
+                "\n",
+                "\n".join(mitigations_list),
+            )
         )
 
     return content
 
 
-def _get_severity_color(severity: str) -> str:
-    """Get color for severity level."""
-    color_map = {
-        "critical": "red",
-        "high": "yellow",
-        "medium": "blue",
-        "low": "green",
-    }
-    return color_map.get(severity, "white")
+def _labelled(label: str, value: str) -> Text:
+    """Build a "Label: value" line with a bold label."""
+    return Text.assemble((f"{label}:", "bold"), " ", value)
@@ -5,12 +5,12 @@ Provides command-line interface for threat modeling operations.
 """
 
 import json
+import sys
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
 from ..core.models import (
     ComponentType,
@@ -20,21 +20,42 @@ from ..core.models import (
     ThreatModel,
     ThreatModelingFramework,
 )
-from ..plugins import load_plugins
-from ..plugins.registry import PluginRegistry
 from ..utils.logging import setup_logging
-from .display import display_threat_model
-from .reporting import generate_markdown_report, generate_mermaid_diagram
-
-# Load plugins at startup
-load_plugins()
+from ._console import console
 
 app = typer.Typer(
     name="ai-threat-model",
     help="Open-source threat modeling tool for AI-native systems",
     add_completion=False,
+    # Help texts contain no Rich markup, so skip parsing it
+    rich_markup_mode=None,
 )
-console = Console()
+
+# Plugins are only needed by analyze, so they are loaded on first use
+_plugins_loaded = False
+
+
+def _ensure_plugins() -> None:
+    """Load and register plugins once, on first use."""
+    global _plugins_loaded
+    if not _plugins_loaded:
+        from ..plugins import load_plugins
+
+        load_plugins()
+        _plugins_loaded = True
+
+
+def _load_or_exit(file_path: Path) -> ThreatModel:
+    """Load a threat model file, printing an error and exiting if that fails."""
+    if not file_path.exists():
+        console.print(f"[red]Error: File {file_path} does not exist[/red]")
+        raise typer.Exit(1)
+
+    try:
+        return ThreatModel.load(str(file_path))
+    except Exception as e:
+        console.print(f"[red]Error loading threat model: {e}[/red]")
+        raise typer.Exit(1)
 
 
 @app.callback()
@@ -48,11 +69,6 @@ def main(
     """
     # Setup logging
     setup_logging(debug=debug)
-    """
-    AI Threat Model - Open-source threat modeling tool for AI-native systems.
-    """
-    # Setup logging
-    setup_logging(debug=debug)
 
 
 @app.command()
@@ -124,17 +140,12 @@ def analyze(
     ),
 ) -> None:
     """Analyze threat model and detect threats."""
-    if not file_path.exists():
-        console.print(f"[red]Error: File {file_path} does not exist[/red]")
-        raise typer.Exit(1)
-
-    try:
-        threat_model = ThreatModel.load(str(file_path))
-    except Exception as e:
-        console.print(f"[red]Error loading threat model: {e}[/red]")
-        raise typer.Exit(1)
+    threat_model = _load_or_exit(file_path)
 
     # Get plugin for system type
+    _ensure_plugins()
+    from ..plugins.registry import PluginRegistry
+
     plugin = PluginRegistry.get_plugin(threat_model.system.type)
     if not plugin:
         console.print(
@@ -145,7 +156,11 @@ def analyze(
 
     # PLOT4AI specific handling
     answers = None
-    if threat_model.system.threat_modeling_framework == ThreatModelingFramework.PLOT4AI:
+    plot4ai_options = any((interactive, lifecycle_phase, category, aitype))
+    if (
+        plot4ai_options
+        and threat_model.system.threat_modeling_framework == ThreatModelingFramework.PLOT4AI
+    ):
         from ..plugins.ai.plot4ai_plugin import Plot4AIPlugin
 
         if isinstance(plugin, Plot4AIPlugin):
@@ -181,7 +196,7 @@ def analyze(
         else:
             threats = plugin.detect_threats(threat_model.system)
     else:
-        # Standard threat detection
+        # Standard threat detection (PLOT4AI without options uses its defaults)
         threats = plugin.detect_threats(threat_model.system)
 
     # Update threat model
@@ -202,6 +217,8 @@ def analyze(
         console.print(f"  AI type filter: {aitype}")
 
     if threats:
+        from rich.table import Table
+
         table = Table(title="Detected Threats")
         table.add_column("ID", style="cyan")
         table.add_column("Category", style="magenta")
@@ -210,9 +227,9 @@ def analyze(
         if lifecycle_phase:
             table.add_column("Phase", style="blue")
 
-        for threat in threats[:10]:  # Show first 10
+        for threat in islice(threats, 10):  # Show first 10
             row_data = [
-                threat.id[:12] if len(threat.id) > 12 else threat.id,
+                threat.id[:12],
                 threat.category,
                 threat.title[:40] + "..." if len(threat.title) > 40 else threat.title,
                 threat.severity.value if threat.severity else "N/A",
@@ -222,7 +239,7 @@ def analyze(
             table.add_row(*row_data)
 
         console.print()
-        console.print(table)
+        console.print(table, soft_wrap=False)
 
         if len(threats) > 10:
             console.print(f"\n... and {len(threats) - 10} more threats")
@@ -235,28 +252,29 @@ def report(
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output file"),
 ) -> None:
     """Generate threat model report."""
-    if not file_path.exists():
-        console.print(f"[red]Error: File {file_path} does not exist[/red]")
-        raise typer.Exit(1)
-
-    try:
-        threat_model = ThreatModel.load(str(file_path))
-    except Exception as e:
-        console.print(f"[red]Error loading threat model: {e}[/red]")
-        raise typer.Exit(1)
+    threat_model = _load_or_exit(file_path)
 
     if format == "markdown":
+        from .reporting import generate_markdown_report
+
         report_content = generate_markdown_report(threat_model)
     elif format == "json":
-        report_content = json.dumps(
-            threat_model.model_dump(mode="json", by_alias=True), indent=2
-        )
+        # Stream JSON straight to its destination rather than building one big string
+        report_data = threat_model.model_dump(mode="json", by_alias=True)
+        if output:
+            with output.open("w", encoding="utf-8") as f:
+                json.dump(report_data, f, indent=2)
+            console.print(f"[green]✓[/green] Report saved to {output}")
+        else:
+            json.dump(report_data, sys.stdout, indent=2)
+            sys.stdout.write("\n")
+        return
     else:
         console.print(f"[red]Error: Unknown format {format}[/red]")
         raise typer.Exit(1)
 
     if output:
-        output.write_text(report_content, encoding="utf-8")
+        output.write_bytes(report_content.encode("utf-8"))
         console.print(f"[green]✓[/green] Report saved to {output}")
     else:
         console.print(report_content)
@@ -267,15 +285,7 @@ def validate(
     file_path: Path = typer.Argument(..., help="Path to threat model file"),
 ) -> None:
     """Validate threat model file."""
-    if not file_path.exists():
-        console.print(f"[red]Error: File {file_path} does not exist[/red]")
-        raise typer.Exit(1)
-
-    try:
-        threat_model = ThreatModel.load(str(file_path))
-    except Exception as e:
-        console.print(f"[red]Error loading threat model: {e}[/red]")
-        raise typer.Exit(1)
+    threat_model = _load_or_exit(file_path)
 
     # Validate threat model
     errors = threat_model.validate()
@@ -294,15 +304,9 @@ def view(
     file_path: Path = typer.Argument(..., help="Path to threat model file"),
 ) -> None:
     """Display threat model in human-readable format."""
-    if not file_path.exists():
-        console.print(f"[red]Error: File {file_path} does not exist[/red]")
-        raise typer.Exit(1)
+    threat_model = _load_or_exit(file_path)
 
-    try:
-        threat_model = ThreatModel.load(str(file_path))
-    except Exception as e:
-        console.print(f"[red]Error loading threat model: {e}[/red]")
-        raise typer.Exit(1)
+    from .display import display_threat_model
 
     display_threat_model(threat_model)
 
@@ -314,24 +318,18 @@ def visualize(
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output file"),
 ) -> None:
     """Generate visualization of threat model."""
-    if not file_path.exists():
-        console.print(f"[red]Error: File {file_path} does not exist[/red]")
-        raise typer.Exit(1)
-
-    try:
-        threat_model = ThreatModel.load(str(file_path))
-    except Exception as e:
-        console.print(f"[red]Error loading threat model: {e}[/red]")
-        raise typer.Exit(1)
+    threat_model = _load_or_exit(file_path)
 
     if format == "mermaid":
+        from .reporting import generate_mermaid_diagram
+
         diagram = generate_mermaid_diagram(threat_model)
     else:
         console.print(f"[red]Error: Unknown format {format}[/red]")
         raise typer.Exit(1)
 
     if output:
-        output.write_text(diagram, encoding="utf-8")
+        output.write_bytes(diagram.encode("utf-8"))
         console.print(f"[green]✓[/green] Diagram saved to {output}")
     else:
         console.print(diagram)
@@ -4,58 +4,96 @@ Reporting utilities for threat models.
 Provides functions for generating reports and visualizations.
 """
 
-from ..core.models import ThreatModel
+import io
+from functools import lru_cache
+
+from ..core.models import SystemType, ThreatModel, ThreatModelingFramework
+
+# Characters that are not valid in Mermaid node IDs
+_MERMAID_ID_TRANS = str.maketrans({"-": "_", " ": "_"})
+
+
+@lru_cache(maxsize=128)
+def _markdown_header(
+    name: str,
+    system_type: SystemType,
+    framework: ThreatModelingFramework,
+    created: str,
+    updated: str,
+) -> str:
+    """Render the report header; cached for repeat reports of unchanged models."""
+    return f"""# Threat Model: {name}
+
+**System Type:** {system_type}
+**Framework:** {framework}
+**Created:** {created}
+**Updated:** {updated}
+
+## Components
+"""
 
 
 def generate_markdown_report(threat_model: ThreatModel) -> str:
     """Generate markdown report from threat model."""
-    lines = [
-        f"# Threat Model: {threat_model.system.name}",
-        "",
-        f"**System Type:** {threat_model.system.type.value}",
-        f"**Framework:** {threat_model.system.threat_modeling_framework.value}",
-        f"**Created:** {threat_model.metadata.created}",
-        f"**Updated:** {threat_model.metadata.updated}",
-        "",
-        "## Components",
-        "",
-    ]
-
-    for component in threat_model.system.components:
-        lines.append(f"- **{component.name}** ({component.type.value})")
+    system = threat_model.system
+    metadata = threat_model.metadata
+    buf = io.StringIO()
+    write = buf.write
+
+    # Every line after the header starts with its own newline, so the report
+    # never ends with a stray blank line.
+    write(
+        _markdown_header(
+            system.name,
+            system.type,
+            system.threat_modeling_framework,
+            # Keyed on the rendered timestamps: equal datetimes in different
+            # timezones compare equal but print differently
+            str(metadata.created),
+            str(metadata.updated),
+        )
+    )
+
+    for component in system.components:
+        write(f"\n- **{component.name}** ({component.type})")
         if component.description:
-            lines.append(f"  - {component.description}")
+            write(f"\n  - {component.description}")
 
-    lines.extend(["", "## Threats", ""])
+    write("\n\n## Threats\n")
 
     if not threat_model.threats:
-        lines.append("*No threats identified yet.*")
+        write("\n*No threats identified yet.*")
     else:
         for threat in threat_model.threats:
-            lines.append(f"### {threat.category}: {threat.title}")
+            write(f"\n### {threat.category}: {threat.title}")
             if threat.description:
-                lines.append(f"{threat.description}")
+                write(f"\n{threat.description}")
             if threat.severity:
-                lines.append(f"**Severity:** {threat.severity.value}")
-            lines.append("")
+                write(f"\n**Severity:** {threat.severity}")
+            write("\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def generate_mermaid_diagram(threat_model: ThreatModel) -> str:
     """Generate Mermaid diagram from threat model."""
-    lines = ["graph TD"]
+    system = threat_model.system
+    buf = io.StringIO()
+    write = buf.write
+    write("graph TD")
+
+    # Sanitize each component ID once; edges reuse the mapping
+    node_ids = {c.id: c.id.translate(_MERMAID_ID_TRANS) for c in system.components}
 
     # Add components as nodes
-    for component in threat_model.system.components:
-        node_id = component.id.replace("-", "_").replace(" ", "_")
+    for component in system.components:
         label = component.name.replace('"', "'")
-        lines.append(f'    {node_id}["{label}"]')
+        write(f'\n    {node_ids[component.id]}["{label}"]')
 
-    # Add data flows as edges
-    for df in threat_model.system.data_flows:
-        from_id = df.from_component.replace("-", "_").replace(" ", "_")
-        to_id = df.to_component.replace("-", "_").replace(" ", "_")
-        lines.append(f"    {from_id} --> {to_id}")
+    # Add data flows as edges (dangling references are still drawn)
+    for df in system.data_flows:
+        from_id = node_ids.get(df.from_component) or df.from_component.translate(_MERMAID_ID_TRANS)
+        to_id = node_ids.get(df.to_component) or df.to_component.translate(_MERMAID_ID_TRANS)
+        write(f"\n    {from_id} --> {to_id}")
 
-    return "\n".join(lines)
+    return buf.getvalue()
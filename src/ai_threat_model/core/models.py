@@ -5,15 +5,31 @@ These models represent the base structure for threat models, components, threats
 and related entities. They are framework-agnostic and work with all system types.
 """
 
-from datetime import datetime
+import secrets
+from datetime import datetime, timezone
 from enum import Enum
-from typing import List, Optional
-from uuid import uuid4
+from typing import Any, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 
-class SystemType(str, Enum):
+def _utcnow() -> datetime:
+    """Current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
+def _new_id() -> str:
+    """Random 128-bit identifier as 32 hex characters."""
+    return secrets.token_hex(16)
+
+
+class _StrEnum(str, Enum):
+    """String enum that formats as its plain value."""
+
+    __str__ = str.__str__
+
+
+class SystemType(_StrEnum):
     """Supported system types."""
 
     LLM_APP = "llm-app"
@@ -27,7 +43,7 @@ class SystemType(str, Enum):
     CLOUD_INFRASTRUCTURE = "cloud-infrastructure"
 
 
-class ThreatModelingFramework(str, Enum):
+class ThreatModelingFramework(_StrEnum):
     """Supported threat modeling frameworks."""
 
     OWASP_LLM_TOP10_2025 = "owasp-llm-top10-2025"
@@ -43,7 +59,7 @@ class ThreatModelingFramework(str, Enum):
     CUSTOM = "custom"
 
 
-class ComponentType(str, Enum):
+class ComponentType(_StrEnum):
     """Component types across all system types."""
 
     # AI-specific
@@ -72,7 +88,7 @@ class ComponentType(str, Enum):
     FIREWALL = "firewall"
 
 
-class TrustLevel(str, Enum):
+class TrustLevel(_StrEnum):
     """Trust levels for components."""
 
     UNTRUSTED = "untrusted"
@@ -81,7 +97,7 @@ class TrustLevel(str, Enum):
     SYSTEM = "system"
 
 
-class DataClassification(str, Enum):
+class DataClassification(_StrEnum):
     """Data classification levels."""
 
     PUBLIC = "public"
@@ -90,7 +106,7 @@ class DataClassification(str, Enum):
     RESTRICTED = "restricted"
 
 
-class Severity(str, Enum):
+class Severity(_StrEnum):
     """Threat severity levels."""
 
     CRITICAL = "critical"
@@ -99,7 +115,7 @@ class Severity(str, Enum):
     LOW = "low"
 
 
-class MitigationStatus(str, Enum):
+class MitigationStatus(_StrEnum):
     """Mitigation implementation status."""
 
     PROPOSED = "proposed"
@@ -111,11 +127,20 @@ class Metadata(BaseModel):
     """Metadata for threat model."""
 
     version: str = Field(..., description="Schema version")
-    created: Optional[datetime] = Field(default_factory=datetime.utcnow, description="Creation timestamp")
-    updated: Optional[datetime] = Field(default_factory=datetime.utcnow, description="Last update timestamp")
+    created: Optional[datetime] = Field(default_factory=_utcnow, description="Creation timestamp")
+    updated: Optional[datetime] = Field(default_factory=_utcnow, description="Last update timestamp")
     author: Optional[str] = Field(None, description="Author or team name")
     description: Optional[str] = Field(None, description="Description of the threat model")
 
+    @model_validator(mode="before")
+    @classmethod
+    def default_timestamps(cls, data: Any) -> Any:
+        """Stamp new metadata with a single shared creation/update time."""
+        if isinstance(data, dict) and "created" not in data and "updated" not in data:
+            now = _utcnow()
+            data = {**data, "created": now, "updated": now}
+        return data
+
 
 class Component(BaseModel):
     """Represents a system component."""
@@ -187,23 +212,25 @@ class RiskScore(BaseModel):
 
     def calculate(self) -> float:
         """Calculate DREAD score as average of all factors."""
-        factors = [
+        total = 0.0
+        count = 0
+        for factor in (
             self.damage,
             self.reproducibility,
             self.exploitability,
             self.affected_users,
             self.discoverability,
-        ]
-        valid_factors = [f for f in factors if f is not None]
-        if not valid_factors:
-            return 0.0
-        return sum(valid_factors) / len(valid_factors)
+        ):
+            if factor is not None:
+                total += factor
+                count += 1
+        return total / count if count else 0.0
 
 
 class Mitigation(BaseModel):
     """Represents a mitigation strategy."""
 
-    id: str = Field(default_factory=lambda: str(uuid4()), description="Unique identifier")
+    id: str = Field(default_factory=_new_id, description="Unique identifier")
     description: str = Field(..., description="Mitigation description")
     implementation: Optional[str] = Field(None, description="Implementation details")
     status: MitigationStatus = Field(default=MitigationStatus.PROPOSED, description="Status")
@@ -213,7 +240,7 @@ class Mitigation(BaseModel):
 class Threat(BaseModel):
     """Represents a threat."""
 
-    id: str = Field(default_factory=lambda: str(uuid4()), description="Unique identifier")
+    id: str = Field(default_factory=_new_id, description="Unique identifier")
     category: str = Field(..., description="Threat category (e.g., LLM01, A01)")
     framework: ThreatModelingFramework = Field(..., description="Framework")
     title: str = Field(..., description="Threat title")
@@ -275,38 +302,48 @@ class ThreatModel(BaseModel):
     @classmethod
     def load(cls, file_path: str) -> "ThreatModel":
         """Load threat model from JSON file."""
-        import json
-
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return cls.model_validate(data)
+        # Parse and validate in a single pydantic-core pass
+        with open(file_path, "rb") as f:
+            return cls.model_validate_json(f.read())
 
     def save(self, file_path: str) -> None:
         """Save threat model to JSON file."""
-        import json
-
         # Update metadata
-        self.metadata.updated = datetime.utcnow()
+        self.metadata.updated = _utcnow()
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(self.model_dump(mode="json", by_alias=True), f, indent=2, ensure_ascii=False)
+        # Serialize in pydantic-core straight to UTF-8 JSON, skipping the intermediate dict
+        with open(file_path, "wb") as f:
+            f.write(self.model_dump_json(by_alias=True, indent=2).encode("utf-8"))
 
     def validate(self) -> List[str]:
         """Validate threat model and return list of errors."""
-        errors = []
+        component_ids = {c.id for c in self.system.components}
+        data_flows = self.system.data_flows
+        threats = self.threats
+
+        # Most models are valid: gather every referenced component ID and check
+        # them all with a single subset test before walking anything in detail
+        referenced = {df.from_component for df in data_flows}
+        referenced.update(df.to_component for df in data_flows)
+        for threat in threats:
+            referenced.update(threat.affected_components)
+        if referenced <= component_ids:
+            return []
+
+        errors: List[str] = []
+        add_error = errors.append
 
         # Validate component IDs in data flows
-        component_ids = {c.id for c in self.system.components}
-        for df in self.system.data_flows:
+        for df in data_flows:
             if df.from_component not in component_ids:
-                errors.append(f"Data flow references unknown component: {df.from_component}")
+                add_error(f"Data flow references unknown component: {df.from_component}")
             if df.to_component not in component_ids:
-                errors.append(f"Data flow references unknown component: {df.to_component}")
+                add_error(f"Data flow references unknown component: {df.to_component}")
 
         # Validate affected components in threats
-        for threat in self.threats:
+        for threat in threats:
             for comp_id in threat.affected_components:
                 if comp_id not in component_ids:
-                    errors.append(f"Threat {threat.id} references unknown component: {comp_id}")
+                    add_error(f"Threat {threat.id} references unknown component: {comp_id}")
 
         return errors
@@ -12,7 +12,8 @@ Author: Isabel Barberá
 """
 
 from enum import Enum
-from typing import List, Optional
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -71,26 +72,47 @@ class Plot4AIDeck(BaseModel):
 
     categories: List[Plot4AICategoryGroup] = Field(default_factory=list, description="All category groups")
 
+    # The deck is read-only once loaded, so card indexes are built on first use
+    @cached_property
+    def all_cards(self) -> Tuple[Plot4AICard, ...]:
+        """All cards from all categories, in deck order."""
+        return tuple(card for category_group in self.categories for card in category_group.cards)
+
+    @cached_property
+    def _cards_by_category(self) -> Dict[str, List[Plot4AICard]]:
+        by_category: Dict[str, List[Plot4AICard]] = {}
+        for category_group in self.categories:
+            by_category.setdefault(category_group.category, category_group.cards)
+        return by_category
+
+    @cached_property
+    def _cards_by_phase(self) -> Dict[str, List[Plot4AICard]]:
+        by_phase: Dict[str, List[Plot4AICard]] = {}
+        for card in self.all_cards:
+            for phase in dict.fromkeys(card.phases):
+                by_phase.setdefault(phase, []).append(card)
+        return by_phase
+
+    @cached_property
+    def _cards_by_aitype(self) -> Dict[str, List[Plot4AICard]]:
+        by_aitype: Dict[str, List[Plot4AICard]] = {}
+        for card in self.all_cards:
+            for aitype in dict.fromkeys(card.aitypes):
+                by_aitype.setdefault(aitype, []).append(card)
+        return by_aitype
+
     def get_all_cards(self) -> List[Plot4AICard]:
         """Get all cards from all categories."""
-        all_cards = []
-        for category_group in self.categories:
-            all_cards.extend(category_group.cards)
-        return all_cards
+        return list(self.all_cards)
 
     def get_cards_by_category(self, category: str) -> List[Plot4AICard]:
         """Get cards for a specific category."""
-        for category_group in self.categories:
-            if category_group.category == category:
-                return category_group.cards
-        return []
+        return self._cards_by_category.get(category, [])
 
     def get_cards_by_phase(self, phase: str) -> List[Plot4AICard]:
         """Get cards applicable to a specific lifecycle phase."""
-        all_cards = self.get_all_cards()
-        return [card for card in all_cards if phase in card.phases]
+        return list(self._cards_by_phase.get(phase, ()))
 
     def get_cards_by_aitype(self, aitype: str) -> List[Plot4AICard]:
         """Get cards applicable to a specific AI type (Traditional or Generative)."""
-        all_cards = self.get_all_cards()
-        return [card for card in all_cards if aitype in card.aitypes]
+        return list(self._cards_by_aitype.get(aitype, ()))
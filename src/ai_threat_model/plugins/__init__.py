@@ -4,11 +4,13 @@ Plugin system for threat modeling.
 Plugins provide type-specific threat detection capabilities.
 """
 
+from typing import TYPE_CHECKING, Type
+
 from .base_plugin import ThreatModelPlugin, ThreatPattern, ValidationResult
-from .registry import PluginRegistry, load_plugins
+from .registry import load_plugins
 
-# Load and register all available plugins
-load_plugins()
+if TYPE_CHECKING:
+    from .registry import PluginRegistry
 
 __all__ = [
     "ThreatModelPlugin",
@@ -17,3 +19,15 @@ __all__ = [
     "PluginRegistry",
     "load_plugins",
 ]
+
+
+def __getattr__(name: str) -> Type["PluginRegistry"]:
+    # Load and register all available plugins the first time the registry is
+    # requested from the package, rather than on every import of it
+    if name == "PluginRegistry":
+        from .registry import PluginRegistry
+
+        load_plugins()
+        globals()["PluginRegistry"] = PluginRegistry
+        return PluginRegistry
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,9 +4,8 @@ Multi-Agent System Plugin for threat modeling.
 Handles threat detection for multi-agent systems using OWASP Multi-Agentic System Threat Modeling Guide.
 """
 
-import json
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from ...core.models import (
     Component,
@@ -18,7 +17,186 @@ from ...core.models import (
     ThreatModelingFramework,
 )
 from ..base_plugin import ThreatModelPlugin, ThreatPattern, ValidationResult
-from .threat_detection import find_data_flow_by_id
+from .pattern_builders import load_json_patterns
+from .threat_detection import find_data_flow_by_id, index_components
+
+
+def _build_default_patterns() -> Tuple[ThreatPattern, ...]:
+    """Build the default threat patterns for multi-agent systems."""
+    return (
+        ThreatPattern(
+            id="MULTI-AGENT-01",
+            category="MULTI-AGENT-01",
+            framework=ThreatModelingFramework.CUSTOM,
+            title="Agent-to-Agent Communication Vulnerabilities",
+            description="Vulnerabilities in communication between agents, including message tampering, replay attacks, and unauthorized access to inter-agent messages.",
+            detection_patterns=[
+                "Agents communicate without encryption",
+                "No authentication between agents",
+                "Message integrity not verified",
+                "No replay attack protection",
+            ],
+            attack_vectors=[
+                "Man-in-the-middle attacks on agent communication",
+                "Message replay attacks",
+                "Message tampering",
+                "Unauthorized message interception",
+            ],
+            mitigations=[
+                {
+                    "id": "secure-communication",
+                    "description": "Encrypt and authenticate all agent-to-agent communication",
+                    "implementation": "Use TLS with mutual authentication",
+                    "priority": "high",
+                },
+                {
+                    "id": "message-integrity",
+                    "description": "Verify message integrity",
+                    "implementation": "Use message authentication codes (MACs)",
+                    "priority": "high",
+                },
+            ],
+        ),
+        ThreatPattern(
+            id="MULTI-AGENT-02",
+            category="MULTI-AGENT-02",
+            framework=ThreatModelingFramework.CUSTOM,
+            title="Orchestration Layer Vulnerabilities",
+            description="Vulnerabilities in the orchestration layer that coordinates multiple agents, including unauthorized agent spawning and coordination manipulation.",
+            detection_patterns=[
+                "Orchestrator has no access controls",
+                "Agents can be spawned without limits",
+                "Orchestration commands not validated",
+                "No monitoring of orchestration activities",
+            ],
+            attack_vectors=[
+                "Orchestrator compromise",
+                "Unauthorized agent spawning",
+                "Coordination manipulation",
+                "Resource exhaustion via agent spawning",
+            ],
+            mitigations=[
+                {
+                    "id": "orchestrator-security",
+                    "description": "Secure the orchestration layer",
+                    "implementation": "Implement access controls and validation",
+                    "priority": "high",
+                },
+                {
+                    "id": "spawn-limits",
+                    "description": "Implement limits on agent spawning",
+                    "implementation": "Set quotas and limits",
+                    "priority": "high",
+                },
+            ],
+        ),
+        ThreatPattern(
+            id="MULTI-AGENT-03",
+            category="MULTI-AGENT-03",
+            framework=ThreatModelingFramework.CUSTOM,
+            title="Shared State Vulnerabilities",
+            description="Vulnerabilities in shared state or memory between agents, including race conditions, state corruption, and unauthorized state access.",
+            detection_patterns=[
+                "Agents share state without synchronization",
+                "No locking mechanisms for shared resources",
+                "State can be corrupted by concurrent access",
+                "No access controls on shared state",
+            ],
+            attack_vectors=[
+                "Race conditions",
+                "State corruption",
+                "Unauthorized state access",
+                "Concurrent modification attacks",
+            ],
+            mitigations=[
+                {
+                    "id": "state-synchronization",
+                    "description": "Implement proper state synchronization",
+                    "implementation": "Use locks, transactions, or immutable state",
+                    "priority": "high",
+                },
+                {
+                    "id": "state-isolation",
+                    "description": "Isolate agent state where possible",
+                    "implementation": "Use separate state stores per agent",
+                    "priority": "medium",
+                },
+            ],
+        ),
+        ThreatPattern(
+            id="MULTI-AGENT-04",
+            category="MULTI-AGENT-04",
+            framework=ThreatModelingFramework.CUSTOM,
+            title="Agent Isolation Failures",
+            description="Failures in isolating agents from each other, allowing unauthorized access to agent resources or data.",
+            detection_patterns=[
+                "Agents share resources without isolation",
+                "No sandboxing between agents",
+                "Agents can access other agents' data",
+                "Resource limits not enforced per agent",
+            ],
+            attack_vectors=[
+                "Cross-agent attacks",
+                "Resource interference",
+                "Data leakage between agents",
+                "Privilege escalation",
+            ],
+            mitigations=[
+                {
+                    "id": "agent-isolation",
+                    "description": "Isolate agents from each other",
+                    "implementation": "Use sandboxing and resource isolation",
+                    "priority": "high",
+                },
+                {
+                    "id": "resource-quotas",
+                    "description": "Enforce resource quotas per agent",
+                    "implementation": "Set CPU, memory, and network limits",
+                    "priority": "medium",
+                },
+            ],
+        ),
+        ThreatPattern(
+            id="MULTI-AGENT-05",
+            category="MULTI-AGENT-05",
+            framework=ThreatModelingFramework.CUSTOM,
+            title="Distributed Decision Making Vulnerabilities",
+            description="Vulnerabilities in distributed decision-making processes, including consensus manipulation and voting attacks.",
+            detection_patterns=[
+                "No consensus mechanism",
+                "Voting can be manipulated",
+                "Decisions not verified",
+                "No quorum requirements",
+            ],
+            attack_vectors=[
+                "Consensus manipulation",
+                "Voting attacks",
+                "Sybil attacks",
+                "Decision corruption",
+            ],
+            mitigations=[
+                {
+                    "id": "consensus-mechanism",
+                    "description": "Implement robust consensus mechanism",
+                    "implementation": "Use Byzantine fault tolerance",
+                    "priority": "high",
+                },
+                {
+                    "id": "decision-verification",
+                    "description": "Verify distributed decisions",
+                    "implementation": "Require quorum and verification",
+                    "priority": "high",
+                },
+            ],
+        ),
+    )
+
+
+# Built once at import and shared by every plugin instance
+_DEFAULT_PATTERNS = _build_default_patterns()
+
+# JSON overrides for the defaults, under <repo>/patterns
+_PATTERNS_DIR = Path(__file__).parents[4] / "patterns" / "ai" / "multi-agent"
 
 
 class MultiAgentPlugin(ThreatModelPlugin):
@@ -45,199 +223,17 @@ class MultiAgentPlugin(ThreatModelPlugin):
     def _load_patterns(self) -> None:
         """Load threat patterns from JSON files, falling back to defaults."""
         # Always start with default patterns
-        default_patterns = self._get_default_patterns()
-        patterns_dict = {p.id: p for p in default_patterns}
-
-        # Try to load JSON files to override or supplement defaults
-        patterns_dir = (
-            Path(__file__).parent.parent.parent.parent.parent
-            / "patterns"
-            / "ai"
-            / "multi-agent"
-        )
-
-        if patterns_dir.exists():
-            for pattern_file in patterns_dir.glob("*.json"):
-                try:
-                    with open(pattern_file, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                        pattern = ThreatPattern(**data)
-                        patterns_dict[pattern.id] = pattern
-                except Exception as e:
-                    from ...utils.logging import log_pattern_load_error
-                    log_pattern_load_error(str(pattern_file), e)
+        patterns_dict = {p.id: p for p in _DEFAULT_PATTERNS}
+
+        # Override defaults with JSON versions where they exist
+        for pattern in load_json_patterns(_PATTERNS_DIR):
+            patterns_dict[pattern.id] = pattern
 
         self._patterns = list(patterns_dict.values())
 
     def _get_default_patterns(self) -> List[ThreatPattern]:
         """Get default threat patterns for multi-agent systems."""
-        return [
-            ThreatPattern(
-                id="MULTI-AGENT-01",
-                category="MULTI-AGENT-01",
-                framework=ThreatModelingFramework.CUSTOM,
-                title="Agent-to-Agent Communication Vulnerabilities",
-                description="Vulnerabilities in communication between agents, including message tampering, replay attacks, and unauthorized access to inter-agent messages.",
-                detection_patterns=[
-                    "Agents communicate without encryption",
-                    "No authentication between agents",
-                    "Message integrity not verified",
-                    "No replay attack protection",
-                ],
-                attack_vectors=[
-                    "Man-in-the-middle attacks on agent communication",
-                    "Message replay attacks",
-                    "Message tampering",
-                    "Unauthorized message interception",
-                ],
-                mitigations=[
-                    {
-                        "id": "secure-communication",
-                        "description": "Encrypt and authenticate all agent-to-agent communication",
-                        "implementation": "Use TLS with mutual authentication",
-                        "priority": "high",
-                    },
-                    {
-                        "id": "message-integrity",
-                        "description": "Verify message integrity",
-                        "implementation": "Use message authentication codes (MACs)",
-                        "priority": "high",
-                    },
-                ],
-            ),
-            ThreatPattern(
-                id="MULTI-AGENT-02",
-                category="MULTI-AGENT-02",
-                framework=ThreatModelingFramework.CUSTOM,
-                title="Orchestration Layer Vulnerabilities",
-                description="Vulnerabilities in the orchestration layer that coordinates multiple agents, including unauthorized agent spawning and coordination manipulation.",
-                detection_patterns=[
-                    "Orchestrator has no access controls",
-                    "Agents can be spawned without limits",
-                    "Orchestration commands not validated",
-                    "No monitoring of orchestration activities",
-                ],
-                attack_vectors=[
-                    "Orchestrator compromise",
-                    "Unauthorized agent spawning",
-                    "Coordination manipulation",
-                    "Resource exhaustion via agent spawning",
-                ],
-                mitigations=[
-                    {
-                        "id": "orchestrator-security",
-                        "description": "Secure the orchestration layer",
-                        "implementation": "Implement access controls and validation",
-                        "priority": "high",
-                    },
-                    {
-                        "id": "spawn-limits",
-                        "description": "Implement limits on agent spawning",
-                        "implementation": "Set quotas and limits",
-                        "priority": "high",
-                    },
-                ],
-            ),
-            ThreatPattern(
-                id="MULTI-AGENT-03",
-                category="MULTI-AGENT-03",
-                framework=ThreatModelingFramework.CUSTOM,
-                title="Shared State Vulnerabilities",
-                description="Vulnerabilities in shared state or memory between agents, including race conditions, state corruption, and unauthorized state access.",
-                detection_patterns=[
-                    "Agents share state without synchronization",
-                    "No locking mechanisms for shared resources",
-                    "State can be corrupted by concurrent access",
-                    "No access controls on shared state",
-                ],
-                attack_vectors=[
-                    "Race conditions",
-                    "State corruption",
-                    "Unauthorized state access",
-                    "Concurrent modification attacks",
-                ],
-                mitigations=[
-                    {
-                        "id": "state-synchronization",
-                        "description": "Implement proper state synchronization",
-                        "implementation": "Use locks, transactions, or immutable state",
-                        "priority": "high",
-                    },
-                    {
-                        "id": "state-isolation",
-                        "description": "Isolate agent state where possible",
-                        "implementation": "Use separate state stores per agent",
-                        "priority": "medium",
-                    },
-                ],
-            ),
-            ThreatPattern(
-                id="MULTI-AGENT-04",
-                category="MULTI-AGENT-04",
-                framework=ThreatModelingFramework.CUSTOM,
-                title="Agent Isolation Failures",
-                description="Failures in isolating agents from each other, allowing unauthorized access to agent resources or data.",
-                detection_patterns=[
-                    "Agents share resources without isolation",
-                    "No sandboxing between agents",
-                    "Agents can access other agents' data",
-                    "Resource limits not enforced per agent",
-                ],
-                attack_vectors=[
-                    "Cross-agent attacks",
-                    "Resource interference",
-                    "Data leakage between agents",
-                    "Privilege escalation",
-                ],
-                mitigations=[
-                    {
-                        "id": "agent-isolation",
-                        "description": "Isolate agents from each other",
-                        "implementation": "Use sandboxing and resource isolation",
-                        "priority": "high",
-                    },
-                    {
-                        "id": "resource-quotas",
-                        "description": "Enforce resource quotas per agent",
-                        "implementation": "Set CPU, memory, and network limits",
-                        "priority": "medium",
-                    },
-                ],
-            ),
-            ThreatPattern(
-                id="MULTI-AGENT-05",
-                category="MULTI-AGENT-05",
-                framework=ThreatModelingFramework.CUSTOM,
-                title="Distributed Decision Making Vulnerabilities",
-                description="Vulnerabilities in distributed decision-making processes, including consensus manipulation and voting attacks.",
-                detection_patterns=[
-                    "No consensus mechanism",
-                    "Voting can be manipulated",
-                    "Decisions not verified",
-                    "No quorum requirements",
-                ],
-                attack_vectors=[
-                    "Consensus manipulation",
-                    "Voting attacks",
-                    "Sybil attacks",
-                    "Decision corruption",
-                ],
-                mitigations=[
-                    {
-                        "id": "consensus-mechanism",
-                        "description": "Implement robust consensus mechanism",
-                        "implementation": "Use Byzantine fault tolerance",
-                        "priority": "high",
-                    },
-                    {
-                        "id": "decision-verification",
-                        "description": "Verify distributed decisions",
-                        "implementation": "Require quorum and verification",
-                        "priority": "high",
-                    },
-                ],
-            ),
-        ]
+        return list(_DEFAULT_PATTERNS)
 
     def detect_threats(self, system: SystemModel) -> List[Threat]:
         """
@@ -266,9 +262,10 @@ class MultiAgentPlugin(ThreatModelPlugin):
         threats.extend(agent_threats)
 
         # Analyze data flows between agents
+        components_by_id = index_components(system)
         for data_flow in system.data_flows:
-            from_agent = system.get_component(data_flow.from_component)
-            to_agent = system.get_component(data_flow.to_component)
+            from_agent = components_by_id.get(data_flow.from_component)
+            to_agent = components_by_id.get(data_flow.to_component)
 
             if from_agent and to_agent and from_agent.type == ComponentType.AGENT and to_agent.type == ComponentType.AGENT:
                 flow_threats = self._analyze_agent_data_flow(data_flow, system, patterns)
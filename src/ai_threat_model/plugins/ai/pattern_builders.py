@@ -1,10 +1,13 @@
 """
 Pattern builders for AI threat patterns.
 
-Provides helper functions for creating threat patterns consistently.
+Provides helper functions for creating and loading threat patterns consistently.
 """
 
-from typing import Dict, List
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Tuple
 
 from ...core.models import ThreatModelingFramework
 from ..base_plugin import ThreatPattern
@@ -92,3 +95,41 @@ def create_mitigation(
     if priority:
         mitigation["priority"] = priority
     return mitigation
+
+
+def load_json_patterns(patterns_dir: Path) -> Tuple[ThreatPattern, ...]:
+    """
+    Load the JSON threat patterns in a directory, or none if it does not exist.
+
+    Parsed patterns are shared across plugin instances. The directory mtime is
+    part of the cache key, so adding or removing pattern files triggers a reload.
+    """
+    if not patterns_dir.exists():
+        return ()
+    return _parse_json_patterns(patterns_dir, patterns_dir.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _parse_json_patterns(patterns_dir: Path, mtime_ns: int) -> Tuple[ThreatPattern, ...]:
+    """Parse the JSON threat patterns in a directory; mtime_ns keys the cache."""
+    # One directory read; like glob("*.json"), skip hidden files
+    with os.scandir(patterns_dir) as entries:
+        pattern_files = [
+            entry.path
+            for entry in entries
+            if entry.name.endswith(".json") and not entry.name.startswith(".") and entry.is_file()
+        ]
+
+    patterns = []
+    for pattern_file in pattern_files:
+        try:
+            # Parse and validate in a single pydantic-core pass
+            with open(pattern_file, "rb") as f:
+                pattern = ThreatPattern.model_validate_json(f.read())
+        except Exception as e:
+            # Log error but continue loading other patterns
+            from ...utils.logging import log_pattern_load_error
+            log_pattern_load_error(pattern_file, e)
+            continue
+        patterns.append(pattern)
+    return tuple(patterns)
@@ -94,16 +94,16 @@ class Plot4AIPlugin(ThreatModelPlugin):
         threats = []
 
         # Get all cards, filtered by criteria
-        cards = deck.get_all_cards()
+        cards = deck.all_cards
 
         if lifecycle_phase:
-            cards = [c for c in cards if lifecycle_phase in c.phases]
+            cards = tuple(c for c in cards if lifecycle_phase in c.phases)
 
         if category:
-            cards = [c for c in cards if category in c.categories]
+            cards = tuple(c for c in cards if category in c.categories)
 
         if aitype:
-            cards = [c for c in cards if aitype in c.aitypes]
+            cards = tuple(c for c in cards if aitype in c.aitypes)
 
         # Convert cards to threats
         for category_group in deck.categories:
@@ -253,16 +253,16 @@ class Plot4AIPlugin(ThreatModelPlugin):
         deck = self._load_deck()
         questions = []
 
-        cards = deck.get_all_cards()
+        cards = deck.all_cards
 
         if lifecycle_phase:
-            cards = [c for c in cards if lifecycle_phase in c.phases]
+            cards = tuple(c for c in cards if lifecycle_phase in c.phases)
 
         if category:
-            cards = [c for c in cards if category in c.categories]
+            cards = tuple(c for c in cards if category in c.categories)
 
         if aitype:
-            cards = [c for c in cards if aitype in c.aitypes]
+            cards = tuple(c for c in cards if aitype in c.aitypes)
 
         for category_group in deck.categories:
             for card_index, card in enumerate(category_group.cards):
@@ -5,12 +5,24 @@ Provides shared functions for detecting threats in components and data flows.
 """
 
 import re
-from typing import List, Optional
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
 
 from ...core.models import Component, DataFlow, Severity, SystemModel, Threat, ThreatModelingFramework, TrustLevel
 from ..base_plugin import ThreatPattern
 
 
+# Common patterns for threat detection, compiled once
+_REGEX_PATTERNS: Tuple[Tuple[str, "re.Pattern[str]"], ...] = tuple(
+    (regex_pattern, re.compile(regex_pattern, re.IGNORECASE))
+    for regex_pattern in (
+        r"no\s+\w+\s+(validation|sanitization|filtering|protection)",
+        r"untrusted\s+\w+",
+        r"excessive\s+\w+",
+        r"arbitrary\s+\w+",
+    )
+)
+
+
 def find_data_flow_by_id(df_id: str, system: SystemModel) -> DataFlow | None:
     """Find a data flow by ID string."""
     for df in system.data_flows:
@@ -20,12 +32,34 @@ def find_data_flow_by_id(df_id: str, system: SystemModel) -> DataFlow | None:
     return None
 
 
+def index_components(system: SystemModel) -> Dict[str, Component]:
+    """Map component IDs to components; the first component with an ID wins."""
+    components_by_id: Dict[str, Component] = {}
+    for component in system.components:
+        components_by_id.setdefault(component.id, component)
+    return components_by_id
+
+
+def index_component_flows(system: SystemModel) -> Dict[str, List[DataFlow]]:
+    """Map component IDs to the data flows from the component, then those to it."""
+    flows_from: Dict[str, List[DataFlow]] = {}
+    flows_to: Dict[str, List[DataFlow]] = {}
+    for df in system.data_flows:
+        flows_from.setdefault(df.from_component, []).append(df)
+        flows_to.setdefault(df.to_component, []).append(df)
+    return {
+        component_id: flows_from.get(component_id, []) + flows_to.get(component_id, [])
+        for component_id in flows_from.keys() | flows_to.keys()
+    }
+
+
 def check_insecure_data_flow(
     data_flow: DataFlow,
     system: SystemModel,
     threat_category: str,
     framework: ThreatModelingFramework,
     threat_title: str,
+    components_by_id: Optional[Mapping[str, Component]] = None,
 ) -> Threat | None:
     """
     Check if a data flow is insecure and create a threat if so.
@@ -36,13 +70,19 @@ def check_insecure_data_flow(
         framework: Threat modeling framework
         threat_category: Threat category code
         threat_title: Threat title
+        components_by_id: Optional precomputed ``index_components(system)``,
+            for callers checking many data flows of one system
 
     Returns:
         Threat object if insecure, None otherwise
     """
     if not data_flow.encrypted and data_flow.classification.value in ["confidential", "restricted"]:
-        from_comp = system.get_component(data_flow.from_component)
-        to_comp = system.get_component(data_flow.to_component)
+        if components_by_id is None:
+            from_comp = system.get_component(data_flow.from_component)
+            to_comp = system.get_component(data_flow.to_component)
+        else:
+            from_comp = components_by_id.get(data_flow.from_component)
+            to_comp = components_by_id.get(data_flow.to_component)
         from_name = from_comp.name if from_comp else data_flow.from_component
         to_name = to_comp.name if to_comp else data_flow.to_component
 
@@ -57,11 +97,31 @@ def check_insecure_data_flow(
     return None
 
 
+def build_searchable_text(component: Component) -> str:
+    """
+    Build the lower-cased text that detection patterns are matched against.
+
+    Args:
+        component: Component to describe
+
+    Returns:
+        Component name, type, description and capabilities as one string
+    """
+    return " ".join([
+        component.name.lower(),
+        component.type.value.lower(),
+        component.description.lower() if component.description else "",
+        " ".join(component.capabilities).lower(),
+    ])
+
+
 def pattern_matches_component(
     pattern: ThreatPattern,
     component: Component,
-    component_types: List[str],
+    component_types: Sequence[str],
     system: Optional[SystemModel] = None,
+    searchable_text: Optional[str] = None,
+    component_flows: Optional[Sequence[DataFlow]] = None,
 ) -> bool:
     """
     Check if a threat pattern matches a component using enhanced detection.
@@ -75,8 +135,12 @@ def pattern_matches_component(
     Args:
         pattern: Threat pattern to check
         component: Component to check
-        component_types: List of component types that should trigger this pattern
+        component_types: Component types that should trigger this pattern
         system: Optional system model for context-aware detection
+        searchable_text: Optional precomputed ``build_searchable_text(component)``,
+            for callers checking many patterns against one component
+        component_flows: Optional precomputed data flows from and to the component,
+            as indexed by ``index_component_flows(system)``
 
     Returns:
         True if pattern matches component
@@ -86,17 +150,11 @@ def pattern_matches_component(
         return True
 
     # 2. Build searchable text from component attributes
-    searchable_text = " ".join([
-        component.name.lower(),
-        component.type.value.lower(),
-        component.description.lower() if component.description else "",
-        " ".join(component.capabilities).lower(),
-    ])
+    if searchable_text is None:
+        searchable_text = build_searchable_text(component)
 
     # 3. Check detection patterns with improved matching
-    for detection_pattern in pattern.detection_patterns:
-        pattern_lower = detection_pattern.lower()
-        
+    for pattern_lower in pattern.detection_patterns_lower:
         # Exact substring match
         if pattern_lower in searchable_text:
             return True
@@ -118,7 +176,7 @@ def pattern_matches_component(
         return True
 
     # 5. Context-aware matching (if system provided)
-    if system and _matches_context(pattern, component, system):
+    if system and _matches_context(pattern, component, system, component_flows):
         return True
 
     return False
@@ -135,17 +193,10 @@ def _matches_regex_pattern(pattern: str, text: str) -> bool:
     Returns:
         True if pattern matches
     """
-    # Common patterns for threat detection
-    regex_patterns = {
-        r"no\s+\w+\s+(validation|sanitization|filtering|protection)": r"no\s+\w+\s+(validation|sanitization|filtering|protection)",
-        r"untrusted\s+\w+": r"untrusted\s+\w+",
-        r"excessive\s+\w+": r"excessive\s+\w+",
-        r"arbitrary\s+\w+": r"arbitrary\s+\w+",
-    }
-
-    for regex_key, regex_pattern in regex_patterns.items():
-        if regex_key in pattern.lower():
-            if re.search(regex_pattern, text, re.IGNORECASE):
+    pattern_lower = pattern.lower()
+    for regex_key, regex in _REGEX_PATTERNS:
+        if regex_key in pattern_lower:
+            if regex.search(text):
                 return True
 
     return False
@@ -168,9 +219,7 @@ def _matches_capabilities(pattern: ThreatPattern, component: Component) -> bool:
     capabilities_lower = " ".join(c.lower() for c in component.capabilities)
     
     # Check if detection patterns mention capabilities that match
-    for detection_pattern in pattern.detection_patterns:
-        pattern_lower = detection_pattern.lower()
-        
+    for pattern_lower in pattern.detection_patterns_lower:
         # Common capability-related keywords
         capability_keywords = [
             "execute", "access", "modify", "delete", "create",
@@ -186,7 +235,10 @@ def _matches_capabilities(pattern: ThreatPattern, component: Component) -> bool:
 
 
 def _matches_context(
-    pattern: ThreatPattern, component: Component, system: SystemModel
+    pattern: ThreatPattern,
+    component: Component,
+    system: SystemModel,
+    component_flows: Optional[Sequence[DataFlow]] = None,
 ) -> bool:
     """
     Check if pattern matches based on system context (data flows, trust levels).
@@ -195,6 +247,7 @@ def _matches_context(
         pattern: Threat pattern to check
         component: Component to check
         system: System model for context
+        component_flows: Optional precomputed data flows from and to the component
 
     Returns:
         True if context matches pattern indicators
@@ -206,17 +259,19 @@ def _matches_context(
             "untrusted", "external", "third-party", "public",
             "user input", "user-generated"
         ]
-        for detection_pattern in pattern.detection_patterns:
-            if any(keyword in detection_pattern.lower() for keyword in untrusted_patterns):
+        for pattern_lower in pattern.detection_patterns_lower:
+            if any(keyword in pattern_lower for keyword in untrusted_patterns):
                 return True
 
     # Check data flow context
-    data_flows_from = system.get_data_flows_from(component.id)
-    data_flows_to = system.get_data_flows_to(component.id)
-    
+    if component_flows is None:
+        component_flows = system.get_data_flows_from(component.id) + system.get_data_flows_to(
+            component.id
+        )
+
     # Check if component handles sensitive data
     sensitive_data_flows = [
-        df for df in data_flows_from + data_flows_to
+        df for df in component_flows
         if df.classification.value in ["confidential", "restricted"]
     ]
     
@@ -225,13 +280,13 @@ def _matches_context(
             "sensitive", "confidential", "restricted", "pii",
             "personal data", "private information"
         ]
-        for detection_pattern in pattern.detection_patterns:
-            if any(keyword in detection_pattern.lower() for keyword in sensitive_patterns):
+        for pattern_lower in pattern.detection_patterns_lower:
+            if any(keyword in pattern_lower for keyword in sensitive_patterns):
                 return True
 
     # Check if component has unencrypted data flows
     unencrypted_flows = [
-        df for df in data_flows_from + data_flows_to
+        df for df in component_flows
         if not df.encrypted and df.classification.value in ["confidential", "restricted"]
     ]
     
@@ -239,8 +294,8 @@ def _matches_context(
         encryption_patterns = [
             "unencrypted", "no encryption", "plaintext", "insecure"
         ]
-        for detection_pattern in pattern.detection_patterns:
-            if any(keyword in detection_pattern.lower() for keyword in encryption_patterns):
+        for pattern_lower in pattern.detection_patterns_lower:
+            if any(keyword in pattern_lower for keyword in encryption_patterns):
                 return True
 
     return False
@@ -249,7 +304,7 @@ def _matches_context(
 def create_threat_from_pattern(
     pattern: ThreatPattern,
     component: Component,
-    severity_map: dict[str, Severity],
+    severity_map: Mapping[str, Severity],
 ) -> Threat:
     """
     Create a Threat object from a pattern.
@@ -5,10 +5,12 @@ Plugins provide type-specific threat detection and analysis capabilities.
 Each system type (LLM, Web App, Mobile, etc.) has its own plugin implementation.
 """
 
+import sys
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from functools import cached_property
+from typing import List, Optional, Tuple
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, field_validator
 
 from ..core.models import (
     Component,
@@ -31,7 +33,19 @@ class ThreatPattern(BaseModel):
     attack_vectors: List[str]
     mitigations: List[dict]
 
-    model_config = ConfigDict(from_attributes=True)
+    # Patterns are shared between plugin instances, so keep them immutable
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    @field_validator("id")
+    @classmethod
+    def intern_id(cls, v: str) -> str:
+        """Intern the ID so lookups keyed on literal pattern IDs compare by identity."""
+        return sys.intern(v)
+
+    @cached_property
+    def detection_patterns_lower(self) -> Tuple[str, ...]:
+        """Detection patterns lower-cased once for case-insensitive matching."""
+        return tuple(detection_pattern.lower() for detection_pattern in self.detection_patterns)
 
 
 class ValidationResult(BaseModel):
@@ -7,7 +7,7 @@ Provides pattern versioning, validation, and dependency management.
 import json
 from pathlib import Path
 from typing import Dict, List, Optional, Set
-from datetime import datetime
+from datetime import datetime, timezone
 
 from pydantic import BaseModel, Field, ValidationError
 
@@ -65,7 +65,7 @@ class PatternRegistry:
             ValueError: If pattern is invalid or conflicts with existing pattern
         """
         # Validate pattern
-        self._validate_pattern(pattern)
+        pattern = self._validate_pattern(pattern)
 
         # Check for conflicts
         if pattern.id in self._patterns:
@@ -86,7 +86,7 @@ class PatternRegistry:
             # Create default metadata
             self._metadata[pattern.id] = PatternMetadata(
                 version="1.0.0",
-                created=datetime.utcnow(),
+                created=datetime.now(timezone.utc),
             )
 
         # Index by framework
@@ -194,13 +194,16 @@ class PatternRegistry:
 
         return conflicts
 
-    def _validate_pattern(self, pattern: ThreatPattern) -> None:
+    def _validate_pattern(self, pattern: ThreatPattern) -> ThreatPattern:
         """
         Validate a pattern.
 
         Args:
             pattern: Pattern to validate
 
+        Returns:
+            The pattern, with its framework normalised to the enum
+
         Raises:
             ValueError: If pattern is invalid
         """
@@ -223,9 +226,14 @@ class PatternRegistry:
         # Validate framework
         if not isinstance(pattern.framework, ThreatModelingFramework):
             try:
-                pattern.framework = ThreatModelingFramework(pattern.framework)
+                # Only reachable for patterns built without validation; patterns are
+                # frozen, so normalise a copy
+                framework = ThreatModelingFramework(pattern.framework)
             except ValueError:
                 raise ValueError(f"Invalid framework: {pattern.framework}")
+            pattern = pattern.model_copy(update={"framework": framework})
+
+        return pattern
 
     def load_patterns_from_directory(self, directory: Path) -> int:
         """
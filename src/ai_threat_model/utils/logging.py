@@ -101,7 +101,7 @@ def log_pattern_load_error(pattern_file: str, error: Exception) -> None:
         error: Exception that occurred
     """
     logger = get_logger()
-    logger.warning(f"Failed to load pattern {pattern_file}: {error}")
+    logger.warning("Failed to load pattern %s: %s", pattern_file, error)
 
 
 def log_threat_detection(
@@ -418,3 +418,34 @@ class TestCLIView:
         assert "Threat 7" in result.stdout
         # Should indicate more threats exist
         assert "more threats" in result.stdout.lower() or "2 more" in result.stdout
+
+
+class TestFindDataFlowById:
+    """Tests for resolving affected data flow IDs in the view."""
+
+    def test_exact_and_partial_matches(self):
+        """Test exact keys, partial IDs and misses."""
+        from ai_threat_model.cli.display import _find_data_flow_by_id, _index_system
+        from ai_threat_model.core.models import DataFlow, SystemModel
+
+        system = SystemModel(
+            name="Test System",
+            type="llm-app",
+            threat_modeling_framework="owasp-llm-top10-2025",
+            data_flows=[
+                DataFlow(from_component="comp1", to_component="comp2"),
+                DataFlow(from_component="comp2", to_component="comp3"),
+            ],
+        )
+        _, flow_by_key = _index_system(system)
+
+        df = _find_data_flow_by_id("comp2->comp3", flow_by_key)
+        assert df is not None
+        assert df.from_component == "comp2"
+
+        # Partial IDs match the first flow containing them
+        df = _find_data_flow_by_id("comp2", flow_by_key)
+        assert df is not None
+        assert df.to_component == "comp2"
+
+        assert _find_data_flow_by_id("comp9", flow_by_key) is None
@@ -54,6 +54,13 @@ class TestLLMPlugin:
         expected_patterns = [f"LLM{i:02d}" for i in range(1, 11)]
         assert set(pattern_ids) == set(expected_patterns)
 
+    def test_json_patterns_shared_across_instances(self):
+        """Test JSON pattern files are parsed once and reused by new instances."""
+        other = LLMPlugin()
+        by_id = {p.id: p for p in self.plugin.get_threat_patterns()}
+        for pattern in other.get_threat_patterns():
+            assert pattern is by_id[pattern.id]
+
     def test_get_threat_patterns_filtered(self):
         """Test getting filtered threat patterns."""
         patterns = self.plugin.get_threat_patterns(ThreatModelingFramework.OWASP_LLM_TOP10_2025)
@@ -61,6 +68,12 @@ class TestLLMPlugin:
         for pattern in patterns:
             assert pattern.framework == ThreatModelingFramework.OWASP_LLM_TOP10_2025
 
+    def test_get_threat_patterns_filtered_returns_copy(self):
+        """Test changing a filtered pattern list leaves the plugin's patterns intact."""
+        framework = ThreatModelingFramework.OWASP_LLM_TOP10_2025
+        self.plugin.get_threat_patterns(framework).clear()
+        assert len(self.plugin.get_threat_patterns(framework)) == 10
+
     def test_detect_threats_with_llm_component(self):
         """Test threat detection with LLM component."""
         llm_component = Component(
@@ -49,6 +49,15 @@ class TestMultiAgentPlugin:
         assert "MULTI-AGENT-01" in pattern_ids
         assert "MULTI-AGENT-05" in pattern_ids
 
+    def test_patterns_shared_across_instances(self):
+        """Test patterns are loaded once and shared by new instances."""
+        other = MultiAgentPlugin()
+        patterns = self.plugin.get_threat_patterns()
+        other_patterns = other.get_threat_patterns()
+        assert other_patterns is not patterns
+        assert all(a is b for a, b in zip(patterns, other_patterns))
+        assert len(other_patterns) == len(patterns)
+
     def test_detect_threats_multiple_agents(self):
         """Test threat detection with multiple agents."""
         agent1 = Component(id="agent1", name="Agent 1", type=ComponentType.AGENT)
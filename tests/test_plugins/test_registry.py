@@ -2,6 +2,8 @@
 Tests for plugin registry.
 """
 
+import importlib
+
 import pytest
 
 from ai_threat_model.core.models import SystemType
@@ -68,3 +70,14 @@ class TestPluginRegistry:
         # Should have loaded at least LLM and Agentic plugins
         assert PluginRegistry.is_registered(SystemType.LLM_APP)
         assert PluginRegistry.is_registered(SystemType.AGENTIC_SYSTEM)
+
+    def test_load_plugins_after_submodule_import(self):
+        """Test that a direct submodule import keeps the shared plugin instances."""
+        importlib.import_module("ai_threat_model.plugins.ai.agentic_plugin")
+        importlib.import_module("ai_threat_model.plugins.ai.multi_agent_plugin")
+        from ai_threat_model.plugins.ai import agentic_plugin, multi_agent_plugin
+        from ai_threat_model.plugins.registry import load_plugins
+
+        load_plugins()
+        assert PluginRegistry.get_plugin(SystemType.AGENTIC_SYSTEM) is agentic_plugin
+        assert PluginRegistry.get_plugin(SystemType.MULTI_AGENT) is multi_agent_plugin
@@ -10,6 +10,7 @@ from ai_threat_model.core.models import (
     DataClassification,
     DataFlow,
     SystemModel,
+    SystemType,
     ThreatModelingFramework,
     TrustLevel,
 )
@@ -17,9 +18,12 @@ from ai_threat_model.plugins.ai.threat_detection import (
     _matches_capabilities,
     _matches_context,
     _matches_regex_pattern,
+    build_searchable_text,
     check_insecure_data_flow,
     create_threat_from_pattern,
     find_data_flow_by_id,
+    index_component_flows,
+    index_components,
     pattern_matches_component,
 )
 from ai_threat_model.plugins.base_plugin import ThreatPattern
@@ -52,6 +56,26 @@ class TestThreatDetectionUtilities:
         df = find_data_flow_by_id("nonexistent", system)
         assert df is None
 
+    def test_index_components_and_flows(self):
+        """Test indexing components by ID and data flows by component."""
+        comp1 = Component(id="comp1", name="Component 1", type=ComponentType.LLM)
+        duplicate = Component(id="comp1", name="Duplicate", type=ComponentType.TOOL)
+        flow1 = DataFlow(from_component="comp1", to_component="comp2")
+        flow2 = DataFlow(from_component="comp2", to_component="comp1")
+        system = SystemModel(
+            name="Test System",
+            type=SystemType.LLM_APP,
+            threat_modeling_framework=ThreatModelingFramework.OWASP_LLM_TOP10_2025,
+            components=[comp1, duplicate],
+            data_flows=[flow1, flow2],
+        )
+
+        assert index_components(system) == {"comp1": comp1}
+        flows_by_component = index_component_flows(system)
+        assert flows_by_component["comp1"] == [flow1, flow2]
+        assert flows_by_component["comp2"] == [flow2, flow1]
+        assert "comp3" not in flows_by_component
+
     def test_check_insecure_data_flow_encrypted(self):
         """Test insecure data flow detection with encrypted flow."""
         system = SystemModel(
@@ -161,6 +185,31 @@ class TestThreatDetectionUtilities:
         # Should match by detection pattern
         assert pattern_matches_component(pattern, component, []) is True
 
+    def test_pattern_matches_component_precomputed_text(self):
+        """Test pattern matching with precomputed searchable text."""
+        pattern = ThreatPattern(
+            id="TEST01",
+            category="TEST01",
+            framework=ThreatModelingFramework.OWASP_LLM_TOP10_2025,
+            title="Test Pattern",
+            description="Test",
+            detection_patterns=["no input validation"],
+            attack_vectors=[],
+            mitigations=[],
+        )
+
+        component = Component(
+            id="comp1",
+            name="Chat API",
+            type=ComponentType.API_ENDPOINT,
+            description="Endpoint with No Input Validation",
+            capabilities=["Chat"],
+        )
+
+        text = build_searchable_text(component)
+        assert text == "chat api api-endpoint endpoint with no input validation chat"
+        assert pattern_matches_component(pattern, component, [], searchable_text=text) is True
+
     def test_pattern_matches_component_capabilities(self):
         """Test pattern matching by capabilities."""
         pattern = ThreatPattern(